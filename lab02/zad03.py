@@ -3,31 +3,107 @@ from graph_representation import Graph
 from graph_visualization import visualize_circular
 from lab02.zad01 import construct_graph, is_graphical_sequence
 
+def traverse(adjacency_list, start, visited, breadth_first=False, target=None, limit=None):
+    """
+    Iteracyjne przejście grafu (DFS z jawnym stosem lub BFS z kolejką) od wierzchołka start.
+
+    W trybie DFS wierzchołek jest oznaczany jako odwiedzony przy zdjęciu ze stosu,
+    a sąsiedzi są odkładani w odwrotnej kolejności, więc kolejność odwiedzania jest
+    taka sama jak w rekurencyjnym DFS (preorder). W trybie BFS wierzchołek jest
+    oznaczany przy dodaniu do kolejki.
+
+    Przejście kończy się wcześniej po odwiedzeniu wierzchołka target albo
+    po odwiedzeniu limit wierzchołków (np. limit = V - wszystkich wierzchołków grafu).
+
+    Args:
+        adjacency_list: Listy sąsiedztwa grafu
+        start: Wierzchołek początkowy
+        visited: bytearray (lub lista) odwiedzin długości V - uzupełniana w miejscu
+        breadth_first: Czy przechodzić wszerz (BFS) zamiast w głąb (DFS)
+        target: Wierzchołek, po którego odwiedzeniu przejście się kończy
+        limit: Liczba wierzchołków, po której odwiedzeniu przejście się kończy
+
+    Returns:
+        Lista wierzchołków odwiedzonych w tym przejściu, w kolejności odwiedzania
+    """
+    if limit is None:
+        limit = len(visited)
+    order = []
+
+    if breadth_first:
+        # Lista order jest jednocześnie kolejką (head - indeks jej początku)
+        visited[start] = 1
+        order.append(start)
+        head = 0
+        while head < len(order) and order[-1] != target and len(order) < limit:
+            v = order[head]
+            head += 1
+            for neighbor in adjacency_list[v]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    order.append(neighbor)
+                    if neighbor == target or len(order) == limit:
+                        return order
+        return order
+
+    stack = [start]
+    while stack:
+        v = stack.pop()
+        if visited[v]:
+            continue
+        visited[v] = 1
+        order.append(v)
+        if v == target or len(order) == limit:
+            break
+        for neighbor in reversed(adjacency_list[v]):
+            if not visited[neighbor]:
+                stack.append(neighbor)
+
+    return order
+
 def dfs(v, graph, visited, component):
-    visited[v] = True
-    component.append(v)
-    for neighbor in graph.get_adjacency_list()[v]:
-        if not visited[neighbor]:
-            dfs(neighbor, graph, visited, component)
+    component.extend(traverse(graph.get_adjacency_list(), v, visited))
 
 def is_graph_connected(graph):
-    visited = [False] * graph.V
-    component = []
-    dfs(0, graph, visited, component)
-    return all(visited)
+    if graph.V == 0:
+        return True
+    # Przejście kończy się, gdy tylko odwiedzi wszystkie wierzchołki
+    visited = bytearray(graph.V)
+    return len(traverse(graph.get_adjacency_list(), 0, visited, limit=graph.V)) == graph.V
 
-def find_largest_connected_component(graph):
-    visited = [False] * graph.V
-    largest_component = []
+def label_components(graph):
+    """
+    Wyznacza spójne składowe grafu w jednym przejściu O(V + E).
+
+    Wszystkie przejścia (traverse) korzystają z jednej tablicy odwiedzin (bytearray).
+
+    Returns:
+        Tuple (labels, sizes): labels - tablica NumPy numerów składowych wierzchołków
+        (składowe numerowane od 0 w kolejności najmniejszych wierzchołków),
+        sizes - tablica NumPy rozmiarów składowych
+    """
+    adjacency_list = graph.get_adjacency_list()
+    visited = bytearray(graph.V)
+    labels = np.full(graph.V, -1, dtype=np.int64)
+    sizes = []
 
-    for v in range(graph.V):
-        if not visited[v]:
-            component = []
-            dfs(v, graph, visited, component)
-            if len(component) > len(largest_component):
-                largest_component = component
+    for start in range(graph.V):
+        if visited[start]:
+            continue
+        component = traverse(adjacency_list, start, visited)
+        labels[component] = len(sizes)
+        sizes.append(len(component))
+
+    return labels, np.array(sizes, dtype=np.int64)
+
+def find_largest_connected_component(graph):
+    labels, sizes = label_components(graph)
+    if len(sizes) == 0:
+        return []
 
-    return largest_component
+    # Pierwsza największa składowa, w kolejności DFS od jej najmniejszego wierzchołka
+    start = int(np.argmax(labels == sizes.argmax()))
+    return traverse(graph.get_adjacency_list(), start, bytearray(graph.V))
 
 def zad03(degree_sequence):
     if is_graphical_sequence(degree_sequence):
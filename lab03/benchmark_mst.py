@@ -0,0 +1,90 @@
+"""
+Porównanie czasu działania algorytmu Prima z kopcem i algorytmu Kruskala.
+
+Graf losowy jest budowany bezpośrednio w listach sąsiedztwa, krawędzi i wag
+(dodawanie krawędzi przez add_edge przebudowuje macierz incydencji i dla
+tysięcy krawędzi trwałoby zbyt długo). Przykładowe uruchomienie:
+
+    python3 benchmark_mst.py --n 2000 --m 50000
+"""
+
+import argparse
+import random
+import time
+from graph_representation import Graph
+from zad5 import prim_mst_heap, kruskal_mst
+
+def generate_benchmark_graph(n, m, min_weight=1, max_weight=1000, seed=None):
+    """
+    Generuje losowy graf spójny z n wierzchołkami i około m krawędziami.
+
+    Najpierw dodawane jest losowe drzewo rozpinające (graf jest spójny), a następnie
+    losowe krawędzie aż do uzyskania m krawędzi (bez pętli i krawędzi wielokrotnych).
+
+    Args:
+        n: Liczba wierzchołków
+        m: Docelowa liczba krawędzi (co najmniej n-1)
+        min_weight: Minimalna waga krawędzi
+        max_weight: Maksymalna waga krawędzi
+        seed: Ziarno generatora liczb losowych
+
+    Returns:
+        Graph: Wygenerowany graf
+    """
+    rng = random.Random(seed)
+    m = min(max(m, n - 1), n * (n - 1) // 2)
+    graph = Graph(n)
+
+    def add(u, v):
+        edge = (min(u, v), max(u, v))
+        if u == v or edge in graph.weights:
+            return
+        graph.adjacency_list[u].append(v)
+        graph.adjacency_list[v].append(u)
+        graph.edges.append(edge)
+        graph.weights[edge] = rng.randint(min_weight, max_weight)
+
+    for v in range(1, n):
+        add(v, rng.randrange(v))
+
+    while len(graph.edges) < m:
+        add(rng.randrange(n), rng.randrange(n))
+
+    return graph
+
+def benchmark(n, m, seed=None):
+    """
+    Wyznacza MST obydwoma algorytmami i wypisuje czasy działania.
+
+    Returns:
+        Tuple (prim_time, kruskal_time): czasy działania w sekundach
+    """
+    print(f"Generowanie grafu z {n} wierzchołkami i {m} krawędziami...")
+    graph = generate_benchmark_graph(n, m, seed=seed)
+
+    start = time.perf_counter()
+    prim_edges, prim_weight = prim_mst_heap(graph)
+    prim_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kruskal_edges = kruskal_mst(graph)
+    kruskal_time = time.perf_counter() - start
+
+    kruskal_weight = sum(graph.get_weight(u, v) for u, v in kruskal_edges)
+    if prim_weight != kruskal_weight or len(prim_edges) != len(kruskal_edges):
+        raise AssertionError("Algorytmy zwróciły drzewa o różnych wagach")
+
+    print(f"Waga MST: {prim_weight}")
+    print(f"Prim (kopiec): {prim_time:.3f} s")
+    print(f"Kruskal: {kruskal_time:.3f} s")
+
+    return prim_time, kruskal_time
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Algorytm Prima z kopcem a algorytm Kruskala')
+    parser.add_argument('--n', type=int, default=2000, help='Liczba wierzchołków')
+    parser.add_argument('--m', type=int, default=50000, help='Liczba krawędzi')
+    parser.add_argument('--seed', type=int, default=0, help='Ziarno generatora liczb losowych')
+
+    args = parser.parse_args()
+    benchmark(args.n, args.m, args.seed)
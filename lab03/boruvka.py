@@ -0,0 +1,141 @@
+"""
+Algorytm Borůvki wyznaczania minimalnego drzewa (lasu) rozpinającego.
+
+W każdej rundzie każda składowa wybiera najlżejszą krawędź prowadzącą do innej
+składowej, wszystkie wybrane krawędzie są dodawane do drzewa, a połączone
+składowe są scalane. Liczba składowych maleje co najmniej dwukrotnie w każdej
+rundzie, więc rund jest O(log V).
+
+Runda jest wykonywana wektorowo na tablicach krawędzi grafu ściągniętego
+(końce krawędzi to etykiety składowych):
+1. Minimum w segmentach wyznaczonych przez składowe (np.minimum.at) - najlżejsza
+   krawędź każdej składowej; zakresy krawędzi mogą być przetwarzane równolegle
+   przez pulę procesów, a częściowe minima są potem łączone
+2. Scalanie - każda składowa wskazuje składową po drugiej stronie swojej krawędzi,
+   a etykiety są wyznaczane przeskakiwaniem wskaźników (pointer jumping)
+3. Ściągnięcie - końce krawędzi otrzymują nowe etykiety, a krawędzie wewnątrz
+   scalonych składowych są usuwane
+
+Krawędzie są porównywane według (waga, u, v), tak jak w kruskal_mst, więc
+drzewo jest jednoznaczne i identyczne z wynikiem algorytmu Kruskala.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from kruskal_numpy import edge_order, graph_edge_arrays
+
+# Klucz oznaczający brak krawędzi wychodzącej poza składową
+NO_EDGE = np.iinfo(np.int64).max
+
+def _component_minima(n, comp_u, comp_v, ranks):
+    """
+    Wyznacza dla każdej składowej najmniejszą rangę incydentnej krawędzi.
+
+    Args:
+        n: Liczba wierzchołków (zakres etykiet składowych)
+        comp_u, comp_v: Etykiety składowych końców krawędzi (różne dla każdej krawędzi)
+        ranks: Rangi krawędzi (pozycje w porządku (waga, u, v))
+
+    Returns:
+        Tablica długości n z minimalnymi rangami (NO_EDGE dla etykiet bez krawędzi)
+    """
+    minima = np.full(n, NO_EDGE, dtype=np.int64)
+    np.minimum.at(minima, comp_u, ranks)
+    np.minimum.at(minima, comp_v, ranks)
+    return minima
+
+def _all_component_minima(n, comp_u, comp_v, ranks, executor=None, workers=1):
+    """Wyznacza _component_minima, opcjonalnie dzieląc krawędzie na zakresy między procesy."""
+    if executor is None:
+        return _component_minima(n, comp_u, comp_v, ranks)
+
+    bounds = np.linspace(0, len(ranks), workers + 1).astype(np.int64)
+    tasks = [(n, comp_u[lo:hi], comp_v[lo:hi], ranks[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+    parts = executor.map(_component_minima, *zip(*tasks))
+    return np.minimum.reduce(list(parts))
+
+def boruvka_arrays(n, us, vs, ws, workers=None):
+    """
+    Wyznacza minimalny las rozpinający grafu podanego tablicami krawędzi algorytmem Borůvki.
+
+    Args:
+        n: Liczba wierzchołków
+        us, vs: Tablice końców krawędzi
+        ws: Tablica wag krawędzi
+        workers: Liczba procesów roboczych dla minimów w składowych (None - bez puli procesów)
+
+    Returns:
+        Tablica NumPy indeksów krawędzi lasu, w kolejności rosnących wag
+    """
+    us = np.asarray(us, dtype=np.int64)
+    vs = np.asarray(vs, dtype=np.int64)
+    ws = np.asarray(ws)
+
+    # Krawędzie w porządku (waga, u, v) - ranga krawędzi to jej pozycja w tym porządku
+    order = edge_order(n, us, vs, ws)
+    comp_u, comp_v = us[order], vs[order]
+    ranks = np.arange(len(order), dtype=np.int64)
+
+    # Pętle nigdy nie należą do drzewa
+    proper = comp_u != comp_v
+    comp_u, comp_v, ranks = comp_u[proper], comp_v[proper], ranks[proper]
+
+    selected = []
+
+    executor = None
+    if workers is not None and workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        while len(ranks):
+            # Najlżejsza krawędź wychodząca z każdej składowej
+            minima = _all_component_minima(n, comp_u, comp_v, ranks, executor, workers)
+            components = np.flatnonzero(minima != NO_EDGE)
+            chosen = minima[components]
+            selected.append(chosen)
+
+            # Każda składowa wskazuje składową po drugiej stronie wybranej krawędzi
+            position = np.searchsorted(ranks, chosen)
+            side_u, side_v = comp_u[position], comp_v[position]
+            other = np.where(side_u == components, side_v, side_u)
+            successor = np.arange(n, dtype=np.int64)
+            successor[components] = other
+
+            # Para składowych wybierających tę samą krawędź - mniejsza zostaje korzeniem
+            mutual = (successor[other] == components) & (components < other)
+            successor[components[mutual]] = components[mutual]
+
+            # Przeskakiwanie wskaźników aż do korzeni
+            while True:
+                jumped = successor[successor]
+                if np.array_equal(jumped, successor):
+                    break
+                successor = jumped
+
+            # Ściągnięcie składowych i usunięcie krawędzi wewnątrz nich
+            comp_u, comp_v = successor[comp_u], successor[comp_v]
+            proper = comp_u != comp_v
+            comp_u, comp_v, ranks = comp_u[proper], comp_v[proper], ranks[proper]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if not selected:
+        return np.zeros(0, dtype=np.int64)
+    # Krawędź wybrana przez obie łączone składowe występuje dwukrotnie
+    return order[np.unique(np.concatenate(selected))]
+
+def boruvka_mst(graph, workers=None):
+    """
+    Algorytm Borůvki - zamiennik kruskal_mst z zad5.
+
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+        workers: Liczba procesów roboczych (None - bez puli procesów)
+
+    Returns:
+        Lista krawędzi należących do MST (te same krawędzie co kruskal_mst)
+    """
+    us, vs, ws = graph_edge_arrays(graph)
+    selected = boruvka_arrays(graph.V, us, vs, ws, workers)
+    return list(zip(us[selected].tolist(), vs[selected].tolist()))
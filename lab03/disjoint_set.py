@@ -0,0 +1,158 @@
+"""
+Struktura zbiorów rozłącznych (Union-Find) oparta na tablicach NumPy.
+
+Tablice parent i size mają długość n i są alokowane raz. Operacje:
+- find - iteracyjne wyszukiwanie korzenia z połowieniem ścieżki
+  (każdy odwiedzony wierzchołek wskazuje potem na swojego dziadka),
+- union - łączenie według rozmiaru (mniejsze drzewo dołączane do większego),
+- find_many / union_many - wersje wsadowe dla tablic wierzchołków i krawędzi,
+  w których większość pracy jest wykonywana wektorowo.
+"""
+
+import numpy as np
+
+class ArrayDisjointSet:
+    """Zbiory rozłączne elementów 0..n-1 przechowywane w tablicach NumPy."""
+
+    def __init__(self, n):
+        """
+        Tworzy n jednoelementowych zbiorów.
+
+        Args:
+            n: Liczba elementów
+        """
+        self.n = n
+        self.parent = np.arange(n, dtype=np.int64)
+        self.size = np.ones(n, dtype=np.int64)
+        self.count = n  # Liczba zbiorów
+
+    def find(self, x):
+        """
+        Zwraca reprezentanta (korzeń) zbioru zawierającego x.
+
+        Args:
+            x: Element
+
+        Returns:
+            Korzeń zbioru
+        """
+        parent = self.parent
+        x = int(x)
+        while True:
+            p = int(parent[x])
+            if p == x:
+                return x
+            grandparent = int(parent[p])
+            parent[x] = grandparent  # Połowienie ścieżki
+            x = grandparent
+
+    def union(self, x, y):
+        """
+        Łączy zbiory zawierające x i y.
+
+        Args:
+            x, y: Elementy
+
+        Returns:
+            bool: True, jeśli zbiory zostały połączone; False, jeśli x i y były już w jednym zbiorze
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        # Łączenie według rozmiaru
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        """Sprawdza, czy x i y należą do tego samego zbioru."""
+        return self.find(x) == self.find(y)
+
+    def find_many(self, xs):
+        """
+        Wyznacza wektorowo korzenie zbiorów dla tablicy elementów.
+
+        Wszystkie ścieżki są skracane jednocześnie (połowienie ścieżki w każdym
+        kroku), a na końcu wszystkie podane elementy wskazują bezpośrednio na korzeń.
+
+        Args:
+            xs: Tablica elementów
+
+        Returns:
+            Tablica NumPy korzeni (tej samej długości co xs)
+        """
+        parent = self.parent
+        xs = np.asarray(xs, dtype=np.int64)
+        roots = xs.copy()
+
+        while True:
+            p = parent[roots]
+            active = p != roots
+            if not active.any():
+                break
+            grandparents = parent[p[active]]
+            parent[roots[active]] = grandparents
+            roots[active] = grandparents
+
+        parent[xs] = roots
+        return roots
+
+    def union_many(self, us, vs):
+        """
+        Łączy zbiory dla kolejnych par (us[i], vs[i]), tak jak wywołania union w pętli.
+
+        Pary, których elementy były w jednym zbiorze już przed wywołaniem, są
+        odrzucane wektorowo (find_many); pozostałe są łączone po kolei, bo
+        wynik zależy od kolejności (np. dla algorytmu Kruskala).
+
+        Args:
+            us, vs: Tablice elementów (tej samej długości)
+
+        Returns:
+            Tablica logiczna - True dla par, których połączenie scaliło dwa zbiory
+        """
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        merged = np.zeros(len(us), dtype=bool)
+        if len(us) == 0:
+            return merged
+
+        roots_u = self.find_many(us)
+        roots_v = self.find_many(vs)
+        candidates = np.flatnonzero(roots_u != roots_v)
+
+        find = self.find
+        parent = self.parent
+        size = self.size
+        for i, root_u, root_v in zip(candidates.tolist(), roots_u[candidates].tolist(),
+                                     roots_v[candidates].tolist()):
+            # Korzenie sprzed wywołania mogły zostać dołączone przez wcześniejsze pary
+            if parent[root_u] != root_u:
+                root_u = find(root_u)
+            if parent[root_v] != root_v:
+                root_v = find(root_v)
+            if root_u == root_v:
+                continue
+
+            if size[root_u] < size[root_v]:
+                root_u, root_v = root_v, root_u
+            parent[root_v] = root_u
+            size[root_u] += size[root_v]
+            merged[i] = True
+
+        self.count -= int(merged.sum())
+        return merged
+
+    def component_labels(self):
+        """
+        Zwraca korzeń zbioru dla każdego elementu.
+
+        Returns:
+            Tablica NumPy długości n
+        """
+        return self.find_many(np.arange(self.n, dtype=np.int64))
@@ -0,0 +1,285 @@
+"""
+Aktualizacja minimalnego drzewa (lasu) rozpinającego po zmianach w grafie.
+
+Zamiast wyznaczać MST od nowa po każdej zmianie, klasa DynamicMST przechowuje
+drzewo jako listy sąsiedztwa i poprawia je lokalnie:
+- dodanie krawędzi (u, v) lub zmniejszenie wagi krawędzi spoza drzewa - jeśli
+  u i v leżą w jednym drzewie, na ścieżce drzewa między nimi szukana jest
+  najcięższa krawędź; jest ona zamieniana na nową, jeśli nowa jest lżejsza
+  (własność cyklu), O(V),
+- zwiększenie wagi krawędzi drzewa lub jej usunięcie - krawędź jest usuwana
+  z drzewa, a dwie powstałe części łączy najlżejsza krawędź między nimi
+  (własność przekroju), O(V + E),
+- zwiększenie wagi krawędzi spoza drzewa i zmniejszenie wagi krawędzi drzewa
+  nie zmieniają drzewa, O(1).
+
+Krawędzie są porównywane według (waga, u, v), tak jak w kruskal_mst, więc po
+każdej zmianie drzewo zawiera te same krawędzie, które zwróciłby kruskal_mst
+dla zmienionego grafu.
+"""
+
+from zad5 import kruskal_mst
+
+class DynamicMST:
+    """Minimalny las rozpinający aktualizowany po dodaniu, usunięciu i zmianie wagi krawędzi."""
+
+    def __init__(self, graph, mst_edges=None):
+        """
+        Tworzy strukturę dla grafu i jego minimalnego lasu rozpinającego.
+
+        Graf nie jest modyfikowany - wagi krawędzi są kopiowane.
+
+        Args:
+            graph: Graf wejściowy (obiekt klasy Graph)
+            mst_edges: Krawędzie MST wyznaczone wcześniej przez kruskal_mst
+                (None - zostaną wyznaczone)
+        """
+        if mst_edges is None:
+            mst_edges = kruskal_mst(graph)
+
+        self.V = graph.V
+        self.weights = {edge: graph.get_weight(*edge) for edge in graph.get_edges()}
+        self.tree_adjacency = [set() for _ in range(self.V)]
+        self.tree_edges = set()
+        self.total_weight = 0
+
+        for u, v in mst_edges:
+            self._link((min(u, v), max(u, v)))
+
+    def _key(self, edge):
+        """Klucz porównania krawędzi - taki sam jak w kruskal_mst."""
+        return (self.weights[edge], edge)
+
+    def _link(self, edge):
+        """Dodaje krawędź do drzewa."""
+        u, v = edge
+        self.tree_adjacency[u].add(v)
+        self.tree_adjacency[v].add(u)
+        self.tree_edges.add(edge)
+        self.total_weight += self.weights[edge]
+
+    def _cut(self, edge):
+        """Usuwa krawędź z drzewa."""
+        u, v = edge
+        self.tree_adjacency[u].discard(v)
+        self.tree_adjacency[v].discard(u)
+        self.tree_edges.discard(edge)
+        self.total_weight -= self.weights[edge]
+
+    def _tree_path(self, u, v):
+        """
+        Wyznacza ścieżkę w drzewie z u do v (iteracyjne DFS).
+
+        Returns:
+            Lista wierzchołków ścieżki (od u do v) lub None, jeśli u i v leżą w różnych drzewach
+        """
+        parent = {u: u}
+        stack = [u]
+        while stack:
+            x = stack.pop()
+            if x == v:
+                break
+            for y in self.tree_adjacency[x]:
+                if y not in parent:
+                    parent[y] = x
+                    stack.append(y)
+
+        if v not in parent:
+            return None
+
+        path = [v]
+        while path[-1] != u:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+    def max_edge_on_path(self, u, v):
+        """
+        Zwraca najcięższą krawędź na ścieżce drzewa między u i v.
+
+        Args:
+            u, v: Wierzchołki
+
+        Returns:
+            Krawędź (a, b) z a < b lub None, jeśli u i v leżą w różnych drzewach (lub u == v)
+        """
+        path = self._tree_path(u, v)
+        if path is None or len(path) < 2:
+            return None
+
+        edges = [(min(a, b), max(a, b)) for a, b in zip(path, path[1:])]
+        return max(edges, key=self._key)
+
+    def _try_insert(self, edge):
+        """
+        Dołącza krawędź spoza drzewa, jeśli jest lżejsza od najcięższej krawędzi cyklu.
+
+        Returns:
+            bool: True, jeśli drzewo się zmieniło
+        """
+        u, v = edge
+        heaviest = self.max_edge_on_path(u, v)
+        if heaviest is None:
+            # Krawędź łączy dwa drzewa lasu
+            self._link(edge)
+            return True
+
+        if self._key(edge) < self._key(heaviest):
+            self._cut(heaviest)
+            self._link(edge)
+            return True
+        return False
+
+    def _reconnect(self, u):
+        """
+        Łączy część drzewa zawierającą u z resztą drzewa najlżejszą krawędzią między nimi.
+
+        Returns:
+            bool: True, jeśli znaleziono krawędź łączącą
+        """
+        # Wierzchołki części drzewa zawierającej u
+        side = {u}
+        stack = [u]
+        while stack:
+            x = stack.pop()
+            for y in self.tree_adjacency[x]:
+                if y not in side:
+                    side.add(y)
+                    stack.append(y)
+
+        # Najlżejsza krawędź spoza drzewa przecinająca podział
+        best = None
+        for edge in self.weights:
+            a, b = edge
+            if (a in side) != (b in side) and edge not in self.tree_edges:
+                if best is None or self._key(edge) < self._key(best):
+                    best = edge
+
+        # Krawędzie spoza drzewa łączą wierzchołki jednego drzewa lasu,
+        # więc każda krawędź przecinająca podział prowadzi do drugiej części
+        if best is None:
+            return False
+
+        self._link(best)
+        return True
+
+    def add_edge(self, u, v, weight=1):
+        """
+        Dodaje krawędź do grafu i aktualizuje MST.
+
+        Dla istniejącej krawędzi działa jak update_weight.
+
+        Args:
+            u, v: Końce krawędzi
+            weight: Waga krawędzi
+
+        Returns:
+            bool: True, jeśli zmieniło się drzewo
+        """
+        if u == v:
+            raise ValueError("Self-loops are not allowed in simple graphs")
+        if not (0 <= u < self.V and 0 <= v < self.V):
+            raise ValueError(f"Vertex indices must be between 0 and {self.V-1}")
+
+        edge = (min(u, v), max(u, v))
+        if edge in self.weights:
+            return self.update_weight(u, v, weight)
+
+        self.weights[edge] = weight
+        return self._try_insert(edge)
+
+    def update_weight(self, u, v, weight):
+        """
+        Zmienia wagę istniejącej krawędzi i aktualizuje MST.
+
+        Args:
+            u, v: Końce krawędzi
+            weight: Nowa waga
+
+        Returns:
+            bool: True, jeśli zmieniło się MST (zbiór krawędzi lub jego waga)
+        """
+        edge = (min(u, v), max(u, v))
+        if edge not in self.weights:
+            raise KeyError(f"Krawędź {edge} nie istnieje")
+
+        old_key = self._key(edge)
+        in_tree = edge in self.tree_edges
+
+        if in_tree:
+            self.total_weight += weight - self.weights[edge]
+        self.weights[edge] = weight
+
+        if self._key(edge) == old_key:
+            return False
+
+        if not in_tree:
+            # Cięższa krawędź spoza drzewa nadal do niego nie należy
+            if self._key(edge) > old_key:
+                return False
+            return self._try_insert(edge)
+
+        # Lżejsza krawędź drzewa nadal do niego należy
+        if self._key(edge) < old_key:
+            return True
+
+        # Cięższa krawędź drzewa - może ją zastąpić krawędź przecinająca ten sam podział
+        self._cut(edge)
+        self._reconnect(edge[0])
+        return True
+
+    def remove_edge(self, u, v):
+        """
+        Usuwa krawędź z grafu i aktualizuje MST.
+
+        Args:
+            u, v: Końce krawędzi
+
+        Returns:
+            bool: True, jeśli zmieniło się drzewo
+        """
+        edge = (min(u, v), max(u, v))
+        if edge not in self.weights:
+            raise KeyError(f"Krawędź {edge} nie istnieje")
+
+        in_tree = edge in self.tree_edges
+        if in_tree:
+            self._cut(edge)
+        del self.weights[edge]
+
+        if in_tree:
+            self._reconnect(edge[0])
+        return in_tree
+
+    def insertion_gain(self, u, v, weight):
+        """
+        Zwraca, o ile zmalałaby waga MST po dodaniu krawędzi (u, v), bez modyfikowania struktury.
+
+        Args:
+            u, v: Końce krawędzi
+            weight: Waga krawędzi
+
+        Returns:
+            Zmniejszenie wagi MST (0, jeśli krawędź nie zmieniłaby drzewa);
+            None, jeśli krawędź łączyłaby dwa drzewa lasu
+        """
+        edge = (min(u, v), max(u, v))
+        if edge in self.tree_edges:
+            # Dla krawędzi drzewa porównujemy z obecną wagą
+            return max(0, self.weights[edge] - weight)
+
+        heaviest = self.max_edge_on_path(u, v)
+        if heaviest is None:
+            return None
+        if (weight, edge) < self._key(heaviest):
+            return self.weights[heaviest] - weight
+        return 0
+
+    def mst_edges(self):
+        """
+        Zwraca krawędzie MST w kolejności rosnących wag (jak kruskal_mst).
+
+        Returns:
+            Lista krawędzi (u, v) z u < v
+        """
+        return sorted(self.tree_edges, key=self._key)
@@ -0,0 +1,187 @@
+"""
+Algorytm Kruskala dla list krawędzi większych niż pamięć RAM (external memory).
+
+Krawędzie są przechowywane w pliku binarnym jako rekordy (u, v, w) typu
+EDGE_DTYPE. Algorytm działa w trzech etapach:
+1. Sortowanie fragmentami - plik jest czytany fragmentami po chunk_edges
+   krawędzi, każdy fragment jest sortowany według (waga, u, v) i zapisywany
+   do osobnego pliku tymczasowego (serii)
+2. Scalanie k serii - z każdej serii w pamięci jest tylko bieżący blok;
+   w każdym kroku wszystkie rekordy nie większe od najmniejszego z ostatnich
+   rekordów bloków są pobierane razem i sortowane wektorowo
+3. Kruskal strumieniowy - scalone bloki trafiają do ArrayDisjointSet
+   (union_many), a krawędzie lasu są od razu dopisywane do pliku wynikowego
+
+W pamięci muszą się zmieścić tylko tablice zbiorów rozłącznych (O(V)),
+jeden fragment podczas sortowania i po jednym bloku z każdej serii.
+"""
+
+import os
+import tempfile
+import numpy as np
+from disjoint_set import ArrayDisjointSet
+from kruskal_numpy import edge_order
+
+# Rekord krawędzi w pliku: końce krawędzi i waga
+EDGE_DTYPE = np.dtype([('u', '<i8'), ('v', '<i8'), ('w', '<f8')])
+
+# Domyślna liczba krawędzi sortowanych naraz w pamięci
+DEFAULT_CHUNK_EDGES = 1 << 22
+
+# Domyślna liczba krawędzi wczytywanych naraz z każdej serii podczas scalania
+DEFAULT_BLOCK_EDGES = 1 << 16
+
+def write_edge_file(path, us, vs, ws, append=False, dtype=EDGE_DTYPE):
+    """
+    Zapisuje (lub dopisuje) krawędzie do pliku binarnego rekordów (u, v, w).
+
+    Args:
+        path: Ścieżka pliku
+        us, vs: Tablice końców krawędzi
+        ws: Tablica wag krawędzi
+        append: Czy dopisać krawędzie na końcu istniejącego pliku
+        dtype: Typ rekordu (pola 'u', 'v', 'w')
+    """
+    records = np.empty(len(us), dtype=dtype)
+    records['u'] = us
+    records['v'] = vs
+    records['w'] = ws
+    with open(path, 'ab' if append else 'wb') as f:
+        records.tofile(f)
+
+def read_edge_file(path, dtype=EDGE_DTYPE):
+    """
+    Zwraca plik krawędzi jako tablicę rekordów mapowaną do pamięci (bez wczytywania).
+
+    Args:
+        path: Ścieżka pliku
+        dtype: Typ rekordu (pola 'u', 'v', 'w')
+
+    Returns:
+        Tablica np.memmap rekordów (pusta tablica dla pustego pliku)
+    """
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
+
+def _sort_records(records, n):
+    """Sortuje rekordy według (waga, u, v), zamieniając końce tak, by u <= v."""
+    us = np.minimum(records['u'], records['v'])
+    vs = np.maximum(records['u'], records['v'])
+    records['u'] = us
+    records['v'] = vs
+    return records[edge_order(n, us, vs, records['w'])]
+
+def sort_runs(path, n, run_dir, chunk_edges=DEFAULT_CHUNK_EDGES, dtype=EDGE_DTYPE):
+    """
+    Dzieli plik krawędzi na posortowane serie zapisane w katalogu run_dir.
+
+    Args:
+        path: Ścieżka pliku krawędzi
+        n: Liczba wierzchołków
+        run_dir: Katalog na pliki serii
+        chunk_edges: Liczba krawędzi sortowanych naraz w pamięci
+        dtype: Typ rekordu
+
+    Returns:
+        Lista ścieżek plików serii
+    """
+    if chunk_edges < 1:
+        raise ValueError("Rozmiar fragmentu musi być dodatni")
+
+    edges = read_edge_file(path, dtype)
+    run_paths = []
+    for start in range(0, len(edges), chunk_edges):
+        chunk = np.array(edges[start:start + chunk_edges])
+        run_path = os.path.join(run_dir, f'run_{len(run_paths):06d}.bin')
+        _sort_records(chunk, n).tofile(run_path)
+        run_paths.append(run_path)
+    return run_paths
+
+def _not_greater(records, bound):
+    """Maska rekordów nie większych od rekordu bound w porządku (waga, u, v)."""
+    w, u, v = records['w'], records['u'], records['v']
+    bw, bu, bv = bound['w'], bound['u'], bound['v']
+    return (w < bw) | ((w == bw) & ((u < bu) | ((u == bu) & (v <= bv))))
+
+def merge_runs(run_paths, n, block_edges=DEFAULT_BLOCK_EDGES, dtype=EDGE_DTYPE):
+    """
+    Scala posortowane serie, zwracając kolejne posortowane bloki krawędzi (generator).
+
+    Args:
+        run_paths: Ścieżki plików serii posortowanych według (waga, u, v)
+        n: Liczba wierzchołków
+        block_edges: Liczba krawędzi wczytywanych naraz z każdej serii
+        dtype: Typ rekordu
+
+    Yields:
+        Tablice rekordów; ich konkatenacja jest posortowana według (waga, u, v)
+    """
+    if block_edges < 1:
+        raise ValueError("Rozmiar bloku musi być dodatni")
+
+    runs = [read_edge_file(run_path, dtype) for run_path in run_paths]
+    positions = [0] * len(runs)
+    buffers = [np.array(run[:block_edges]) for run in runs]
+
+    while True:
+        active = [i for i, buffer in enumerate(buffers) if len(buffer)]
+        if not active:
+            return
+
+        # Wszystkie rekordy nie większe od najmniejszego z ostatnich rekordów bloków
+        # poprzedzają rekordy jeszcze niewczytane, więc można je wydać
+        lasts = np.array([buffers[i][-1] for i in active], dtype=dtype)
+        bound = lasts[edge_order(n, lasts['u'], lasts['v'], lasts['w'])[0]]
+
+        taken = []
+        for i in active:
+            buffer = buffers[i]
+            count = int(_not_greater(buffer, bound).sum())
+            taken.append(buffer[:count])
+            buffers[i] = buffer[count:]
+
+            # Blok wyczerpany - wczytaj kolejny z tej serii
+            if len(buffers[i]) == 0:
+                positions[i] += block_edges
+                buffers[i] = np.array(runs[i][positions[i]:positions[i] + block_edges])
+
+        block = np.concatenate(taken)
+        yield block[edge_order(n, block['u'], block['v'], block['w'])]
+
+def external_kruskal(path, n, out_path, chunk_edges=DEFAULT_CHUNK_EDGES,
+                     block_edges=DEFAULT_BLOCK_EDGES, tmp_dir=None, dtype=EDGE_DTYPE):
+    """
+    Wyznacza minimalny las rozpinający grafu zapisanego w pliku krawędzi.
+
+    Krawędzie lasu są zapisywane do out_path (ten sam format rekordów, u < v)
+    w kolejności rosnących wag - tej samej co w kruskal_mst.
+
+    Args:
+        path: Ścieżka pliku krawędzi (rekordy dtype)
+        n: Liczba wierzchołków
+        out_path: Ścieżka pliku wynikowego
+        chunk_edges: Liczba krawędzi sortowanych naraz w pamięci
+        block_edges: Liczba krawędzi wczytywanych naraz z każdej serii
+        tmp_dir: Katalog na pliki tymczasowe (None - katalog systemowy)
+        dtype: Typ rekordu
+
+    Returns:
+        Tuple (edge_count, total_weight): liczba krawędzi lasu i ich suma wag
+    """
+    dsu = ArrayDisjointSet(n)
+    edge_count = 0
+    total_weight = 0
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir, open(out_path, 'wb') as out:
+        run_paths = sort_runs(path, n, run_dir, chunk_edges, dtype)
+        for block in merge_runs(run_paths, n, block_edges, dtype):
+            if dsu.count == 1:
+                break
+            merged = dsu.union_many(block['u'], block['v'])
+            selected = block[merged]
+            selected.tofile(out)
+            edge_count += len(selected)
+            total_weight += selected['w'].sum()
+
+    return edge_count, total_weight
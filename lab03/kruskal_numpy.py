@@ -0,0 +1,166 @@
+"""
+Wektorowy algorytm Kruskala (NumPy) oraz jego wariant Filter-Kruskal.
+
+Krawędzie są przechowywane w trzech tablicach (us, vs, ws) i sortowane jedną
+operacją NumPy, a następnie przekazywane w dużych partiach do struktury
+ArrayDisjointSet (union_many). Kolejność krawędzi o równych wagach jest taka
+sama jak w kruskal_mst (według (u, v)), więc wynik jest identyczny.
+
+Filter-Kruskal dzieli krawędzie względem wagi osiowej: najpierw rekurencyjnie
+przetwarzane są lżejsze krawędzie, a z cięższych przed dalszym podziałem
+usuwane są wektorowo te, których końce leżą już w jednej składowej. W grafach
+gęstych większość krawędzi jest w ten sposób odrzucana bez sortowania.
+"""
+
+import numpy as np
+from disjoint_set import ArrayDisjointSet
+
+# Liczba krawędzi przekazywanych naraz do union_many
+BATCH_SIZE = 1 << 16
+
+# Liczba krawędzi, poniżej której Filter-Kruskal sortuje zamiast dzielić
+FILTER_THRESHOLD = 1 << 16
+
+# Liczba krawędzi w próbce, z której wyznaczana jest waga osiowa
+PIVOT_SAMPLE_SIZE = 1024
+
+def graph_edge_arrays(graph):
+    """
+    Zwraca krawędzie grafu jako tablice NumPy.
+
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+
+    Returns:
+        Tuple (us, vs, ws): końce krawędzi (u < v) i ich wagi
+    """
+    edges = graph.get_edges()
+    weights = graph.get_weights()
+    us = np.fromiter((u for u, _ in edges), dtype=np.int64, count=len(edges))
+    vs = np.fromiter((v for _, v in edges), dtype=np.int64, count=len(edges))
+    ws = np.array([weights.get(edge, 0) for edge in edges])
+    if ws.dtype.kind not in 'if':
+        ws = ws.astype(np.float64)
+    return us, vs, ws
+
+def edge_order(n, us, vs, ws):
+    """
+    Zwraca permutację sortującą krawędzie według (waga, u, v).
+
+    Dla wag całkowitych, gdy to możliwe, trójka jest kodowana w jednym kluczu int64
+    (jedno sortowanie zamiast np.lexsort, które jest kilkukrotnie wolniejsze).
+    W pozostałych przypadkach krawędzie są sortowane stabilnie według wag,
+    a według (u, v) porządkowane są już tylko grupy krawędzi o równych wagach.
+    """
+    if len(ws) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if ws.dtype.kind == 'i':
+        low = int(ws.min())
+        span = int(ws.max()) - low + 1
+        if span * n * n < 2 ** 63:
+            return np.argsort(((ws - low) * n + us) * n + vs)
+
+    order = np.argsort(ws, kind='stable')
+    sorted_ws = ws[order]
+    equal = sorted_ws[1:] == sorted_ws[:-1]
+    if not equal.any():
+        return order
+
+    # Pozycje należące do grup równych wag i numery tych grup
+    in_group = np.zeros(len(order), dtype=bool)
+    in_group[1:] |= equal
+    in_group[:-1] |= equal
+    group = np.concatenate(([0], np.cumsum(~equal)))
+    positions = np.flatnonzero(in_group)
+    tied = order[positions]
+    order[positions] = tied[np.lexsort((vs[tied], us[tied], group[positions]))]
+    return order
+
+def _kruskal_sorted(dsu, us, vs, ws, ids):
+    """
+    Sortuje krawędzie ids według (waga, u, v) i dodaje je do lasu partiami.
+
+    Returns:
+        Lista tablic indeksów krawędzi dołączonych do lasu (w kolejności dołączania)
+    """
+    ids = ids[edge_order(dsu.n, us[ids], vs[ids], ws[ids])]
+
+    selected = []
+    for start in range(0, len(ids), BATCH_SIZE):
+        if dsu.count == 1:
+            break
+        batch = ids[start:start + BATCH_SIZE]
+        merged = dsu.union_many(us[batch], vs[batch])
+        selected.append(batch[merged])
+
+    return selected
+
+def kruskal_arrays(n, us, vs, ws, filter_kruskal=False, threshold=FILTER_THRESHOLD):
+    """
+    Wyznacza minimalny las rozpinający grafu podanego tablicami krawędzi.
+
+    Args:
+        n: Liczba wierzchołków
+        us, vs: Tablice końców krawędzi
+        ws: Tablica wag krawędzi
+        filter_kruskal: Czy użyć wariantu Filter-Kruskal
+        threshold: Rozmiar zbioru krawędzi, poniżej którego Filter-Kruskal sortuje
+
+    Returns:
+        Tablica NumPy indeksów krawędzi lasu, w kolejności rosnących wag
+    """
+    us = np.asarray(us, dtype=np.int64)
+    vs = np.asarray(vs, dtype=np.int64)
+    ws = np.asarray(ws)
+    dsu = ArrayDisjointSet(n)
+    all_ids = np.arange(len(us), dtype=np.int64)
+
+    if not filter_kruskal:
+        selected = _kruskal_sorted(dsu, us, vs, ws, all_ids)
+    else:
+        selected = []
+        # Stos zbiorów krawędzi do przetworzenia; lżejsze części są zdejmowane pierwsze
+        stack = [(all_ids, False)]
+        while stack and dsu.count > 1:
+            ids, needs_filter = stack.pop()
+
+            # Usuń krawędzie wewnątrz już połączonych składowych
+            if needs_filter and len(ids):
+                ids = ids[dsu.find_many(us[ids]) != dsu.find_many(vs[ids])]
+
+            if len(ids) <= threshold:
+                selected.extend(_kruskal_sorted(dsu, us, vs, ws, ids))
+                continue
+
+            # Waga osiowa - mediana równomiernej próbki krawędzi
+            step = max(1, len(ids) // PIVOT_SAMPLE_SIZE)
+            pivot = np.median(ws[ids[::step]])
+            light = ws[ids] <= pivot
+
+            if light.all():
+                # Wszystkie wagi są nie większe od osi - podział nic nie daje
+                selected.extend(_kruskal_sorted(dsu, us, vs, ws, ids))
+                continue
+
+            stack.append((ids[~light], True))
+            stack.append((ids[light], False))
+
+    if not selected:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(selected)
+
+def kruskal_mst_numpy(graph, filter_kruskal=False):
+    """
+    Wektorowy algorytm Kruskala - zamiennik kruskal_mst z zad5.
+
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+        filter_kruskal: Czy użyć wariantu Filter-Kruskal
+
+    Returns:
+        Lista krawędzi należących do MST (te same krawędzie co kruskal_mst)
+    """
+    us, vs, ws = graph_edge_arrays(graph)
+    selected = kruskal_arrays(graph.V, us, vs, ws, filter_kruskal)
+    return list(zip(us[selected].tolist(), vs[selected].tolist()))
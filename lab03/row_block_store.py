@@ -0,0 +1,171 @@
+"""
+Zapis macierzy odległości (i poprzedników) na dysk blokami wierszy.
+
+Macierz V×V jest plikiem .npy mapowanym do pamięci, do którego kolejne wiersze
+są zapisywane zaraz po wyznaczeniu, więc cała macierz nigdy nie znajduje się
+w pamięci RAM. Po zapisaniu każdego bloku wierszy plik jest synchronizowany,
+a liczba ukończonych wierszy trafia do pliku postępu (<plik>.progress.json).
+Po awarii obliczenia można wznowić od pierwszego nieukończonego bloku.
+
+Moduł jest wspólny dla lab03 (zad3) i lab04 (johnson) - nie importuje żadnych
+innych modułów laboratoriów.
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+
+# Domyślna liczba wierszy w bloku zapisywanym przed aktualizacją pliku postępu
+DEFAULT_BLOCK_ROWS = 64
+
+# Wartość oznaczająca brak poprzednika w pliku poprzedników
+NO_PREDECESSOR = -1
+
+def data_fingerprint(*arrays):
+    """
+    Zwraca skrót SHA-256 zawartości tablic - odcisk danych wejściowych dla RowBlockStore.
+
+    Skrót obejmuje typ, kształt i bajty każdej tablicy, więc dowolna zmiana grafu
+    (np. zamiana dwóch wag) daje inny odcisk.
+
+    Args:
+        arrays: Tablice opisujące graf (np. indptr, indices i weights grafu CSR)
+
+    Returns:
+        Skrót w postaci szesnastkowej
+    """
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f'{array.dtype.str}{array.shape}'.encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+class RowBlockStore:
+    """
+    Macierz odległości n×n zapisywana na dysk wiersz po wierszu, z możliwością wznowienia.
+
+    Odległości są zapisywane jako float64 (np.inf dla par nieosiągalnych),
+    a opcjonalni poprzednicy jako int32 (-1 dla braku poprzednika). Wiersze
+    muszą być zapisywane po kolei, począwszy od next_row.
+    """
+
+    def __init__(self, path, n, block_rows=DEFAULT_BLOCK_ROWS, predecessors_path=None, fingerprint=None):
+        """
+        Otwiera (lub tworzy) pliki macierzy i wczytuje postęp poprzedniego uruchomienia.
+
+        Postęp jest wykorzystywany tylko wtedy, gdy plik postępu opisuje te same
+        parametry (n, rozmiar bloku, plik poprzedników, odcisk grafu), a pliki
+        macierzy istnieją; w przeciwnym razie obliczenia zaczynają się od początku.
+
+        Args:
+            path: Ścieżka pliku .npy z macierzą odległości
+            n: Liczba wierzchołków
+            block_rows: Liczba wierszy w bloku
+            predecessors_path: Ścieżka pliku .npy z macierzą poprzedników (opcjonalna)
+            fingerprint: Odcisk danych wejściowych (zob. data_fingerprint),
+                         który musi się zgadzać, aby wznowić obliczenia
+        """
+        if block_rows < 1:
+            raise ValueError("Rozmiar bloku musi być dodatni")
+
+        self.path = path
+        self.predecessors_path = predecessors_path
+        self.progress_path = path + '.progress.json'
+        self.n = n
+        self.block_rows = block_rows
+        self._header = {
+            'n': n,
+            'block_rows': block_rows,
+            'predecessors_path': predecessors_path,
+            'fingerprint': fingerprint,
+        }
+
+        completed = self._load_progress()
+        mode = 'r+' if completed is not None else 'w+'
+
+        self.distances = np.lib.format.open_memmap(path, mode=mode, dtype=np.float64, shape=(n, n))
+        self.predecessors = None
+        if predecessors_path is not None:
+            self.predecessors = np.lib.format.open_memmap(predecessors_path, mode=mode,
+                                                          dtype=np.int32, shape=(n, n))
+
+        if completed is None:
+            completed = 0
+            self._save_progress(completed)
+
+        self.next_row = completed
+
+    def _load_progress(self):
+        """Zwraca liczbę ukończonych wierszy z pliku postępu lub None, jeśli nie można wznowić."""
+        paths = [self.path, self.progress_path]
+        if self.predecessors_path is not None:
+            paths.append(self.predecessors_path)
+        if not all(os.path.exists(p) for p in paths):
+            return None
+
+        try:
+            with open(self.progress_path) as f:
+                progress = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if any(progress.get(key) != value for key, value in self._header.items()):
+            return None
+        return progress.get('completed_rows')
+
+    def _save_progress(self, completed):
+        """Zapisuje atomowo liczbę ukończonych wierszy (zapis do pliku tymczasowego i zamiana)."""
+        progress = dict(self._header, completed_rows=completed)
+        tmp_path = self.progress_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(progress, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.progress_path)
+
+    @property
+    def complete(self):
+        """Czy wszystkie wiersze macierzy zostały zapisane."""
+        return self.next_row >= self.n
+
+    def write_row(self, u, distances, predecessors=None):
+        """
+        Zapisuje wiersz u macierzy odległości (i poprzedników).
+
+        Args:
+            u: Indeks wiersza (musi być równy next_row)
+            distances: Odległości od u do wszystkich wierzchołków
+            predecessors: Poprzednicy na najkrótszych ścieżkach z u (None lub -1 dla braku)
+        """
+        if u != self.next_row:
+            raise ValueError(f"Oczekiwano wiersza {self.next_row}, otrzymano {u}")
+
+        self.distances[u] = distances
+        if self.predecessors is not None and predecessors is not None:
+            self.predecessors[u] = [p if p is not None else NO_PREDECESSOR for p in predecessors]
+
+        self.next_row += 1
+        if self.next_row % self.block_rows == 0 or self.next_row == self.n:
+            self.commit()
+
+    def commit(self):
+        """Synchronizuje zapisane wiersze z dyskiem i aktualizuje plik postępu."""
+        self.distances.flush()
+        if self.predecessors is not None:
+            self.predecessors.flush()
+        self._save_progress(self.next_row)
+
+    def open_result(self):
+        """
+        Otwiera gotowe macierze do odczytu.
+
+        Returns:
+            Tuple (D, P): macierze mapowane z plików w trybie tylko do odczytu
+                (P jest None, jeśli nie zapisywano poprzedników)
+        """
+        self.commit()
+        D = np.load(self.path, mmap_mode='r')
+        P = np.load(self.predecessors_path, mmap_mode='r') if self.predecessors_path is not None else None
+        return D, P
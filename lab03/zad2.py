@@ -75,8 +75,9 @@ def dijkstra(graph, s):
     Algorytm Dijkstry do znajdowania najkrótszych ścieżek z wierzchołka s.
     
     Algorytm używa kolejki priorytetowej, aby efektywnie wybierać wierzchołek 
-    o najmniejszej odległości w każdej iteracji. Złożoność czasowa wynosi O((V+E)log V),
-    gdzie V to liczba wierzchołków, a E to liczba krawędzi.
+    o najmniejszej odległości w każdej iteracji, a sąsiadów odczytuje z listy
+    sąsiedztwa. Złożoność czasowa wynosi O((V+E)log V), gdzie V to liczba
+    wierzchołków, a E to liczba krawędzi.
     
     Args:
         graph: Graf wejściowy (obiekt klasy Graph)
@@ -89,6 +90,7 @@ def dijkstra(graph, s):
     """
     n = graph.V
     ds, ps = init(graph, s)
+    adjacency_list = graph.get_adjacency_list()
     
     # Zbiór S wierzchołków o ustalonych najkrótszych ścieżkach (na początku pusty)
     S = set()
@@ -109,21 +111,83 @@ def dijkstra(graph, s):
         S.add(u)
         
         # Relaksacja wszystkich krawędzi wychodzących z u
-        for v in range(n):
-            # Sprawdź czy (u, v) jest krawędzią w grafie
-            # W grafie nieskierowanym krawędzie są przechowywane jako (min(u,v), max(u,v))
-            edge = (min(u, v), max(u, v))
-            
-            # Relaksuj tylko jeśli krawędź istnieje i wierzchołek docelowy nie jest w S
-            if edge in graph.get_weights() and v not in S:
+        # Lista sąsiedztwa zawiera tylko istniejące krawędzie, więc nie trzeba
+        # sprawdzać wszystkich n wierzchołków (O(deg(u)) zamiast O(V))
+        for v in adjacency_list[u]:
+            # Relaksuj tylko jeśli wierzchołek docelowy nie jest w S
+            if v not in S:
                 weight = graph.get_weight(u, v)
-                
+
                 # Jeśli znaleziono lepszą ścieżkę, dodaj wierzchołek do kolejki z nową odległością
                 if relax(u, v, weight, ds, ps):
                     heapq.heappush(queue, (ds[v], v))
     
     return ds, ps
 
+def dijkstra_bounded(graph, s, max_distance=None, k_nearest=None):
+    """
+    Algorytm Dijkstry zatrzymywany po osiągnięciu ograniczenia odległości lub liczby wierzchołków.
+    
+    Przeszukiwanie kończy się, gdy:
+    - odległość kolejnego wierzchołka z kolejki przekracza max_distance, lub
+    - ustalono już k_nearest wierzchołków (licząc wierzchołek źródłowy).
+    Zamiast tablic długości V (jak w init) używane są słowniki, więc koszt zależy
+    wyłącznie od odwiedzonej części grafu, a nie od jego rozmiaru.
+    
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+        s: Wierzchołek źródłowy (indeks)
+        max_distance: Maksymalna odległość ustalanych wierzchołków (None - bez ograniczenia)
+        k_nearest: Maksymalna liczba ustalanych wierzchołków (None - bez ograniczenia)
+        
+    Returns:
+        Tuple (ds, ps): 
+        - ds: słownik {wierzchołek: odległość od s} dla ustalonych wierzchołków,
+          w kolejności rosnącej odległości
+        - ps: słownik {wierzchołek: poprzednik} dla tych samych wierzchołków
+          (poprzednik źródła to None), zgodny z get_path
+    """
+    if s < 0 or s >= graph.V:
+        raise ValueError(f"Wierzchołek startowy musi być w zakresie 0-{graph.V-1}")
+    
+    adjacency_list = graph.get_adjacency_list()
+    
+    # Ustalone wierzchołki i ich odległości
+    ds = {}
+    ps = {}
+    
+    # Odległości i poprzednicy wierzchołków w kolejce (jeszcze nieustalonych)
+    tentative = {s: 0}
+    parents = {s: None}
+    queue = [(0, s)]
+    
+    while queue:
+        if k_nearest is not None and len(ds) >= k_nearest:
+            break
+        
+        dist_u, u = heapq.heappop(queue)
+        
+        # Pomiń duplikaty w kolejce
+        if u in ds:
+            continue
+        
+        # Kolejne wierzchołki są co najmniej tak samo odległe - koniec przeszukiwania
+        if max_distance is not None and dist_u > max_distance:
+            break
+        
+        ds[u] = dist_u
+        ps[u] = parents[u]
+        
+        for v in adjacency_list[u]:
+            if v not in ds:
+                new_distance = dist_u + graph.get_weight(u, v)
+                if new_distance < tentative.get(v, float('inf')):
+                    tentative[v] = new_distance
+                    parents[v] = u
+                    heapq.heappush(queue, (new_distance, v))
+    
+    return ds, ps
+
 def get_path(ps, s, v):
     """
     Odzyskuje ścieżkę z wierzchołka s do v na podstawie tablicy poprzedników.
@@ -133,7 +197,8 @@ def get_path(ps, s, v):
     jako lista wierzchołków w kolejności od s do v.
     
     Args:
-        ps: Tablica poprzedników (wynik algorytmu Dijkstry)
+        ps: Tablica poprzedników (wynik algorytmu Dijkstry) lub słownik
+            poprzedników (wynik dijkstra_bounded)
         s: Wierzchołek źródłowy (indeks)
         v: Wierzchołek docelowy (indeks)
         
@@ -147,7 +212,7 @@ def get_path(ps, s, v):
     # Przechodzimy wstecz od wierzchołka v do s używając tablicy poprzedników
     while current is not None:
         path.append(current)
-        current = ps[current]  # Przejście do poprzednika
+        current = ps.get(current) if isinstance(ps, dict) else ps[current]  # Przejście do poprzednika
     
     # Odwróć ścieżkę, aby była w kolejności od s do v
     path.reverse()
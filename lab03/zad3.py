@@ -13,12 +13,116 @@ Macierz odległości ma wiele zastosowań, m.in.:
 - Znajdowanie centrów grafu
 - Analizowanie dostępności wierzchołków
 - Obliczanie średniego dystansu w grafie
+
+Dla dużych grafów dostępna jest też leniwa macierz odległości (LazyDistanceMatrix),
+która uruchamia algorytm Dijkstry dopiero przy pierwszym odwołaniu do danego wiersza
+i przechowuje ostatnio używane wiersze w pamięci podręcznej LRU o ograniczonym rozmiarze,
+a bardzo duże macierze można zapisywać na dysk blokami wierszy (RowBlockStore)
+z możliwością wznowienia przerwanych obliczeń.
 """
 
+import heapq
+from collections import OrderedDict
+import numpy as np
 from zad1 import zad1
 from zad2 import dijkstra
+from row_block_store import DEFAULT_BLOCK_ROWS, RowBlockStore, data_fingerprint
+
+# Szacunkowa liczba bajtów zajmowana przez jeden element wiersza (wskaźnik listy
+# i obiekt liczby), używana do przeliczenia budżetu pamięci na liczbę wierszy
+ROW_ENTRY_BYTES = 32
+
+# Domyślny budżet pamięci dla wierszy przechowywanych przez LazyDistanceMatrix
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
 
-def compute_distance_matrix(graph):
+class LazyDistanceMatrix:
+    """
+    Leniwa macierz odległości - wiersze są wyznaczane algorytmem Dijkstry na żądanie.
+    
+    Obiekt zachowuje się jak lista list zwracana przez compute_distance_matrix:
+    obsługuje len(), indeksowanie (macierz[i][j]) oraz iterację po wierszach, więc
+    może być przekazany do find_graph_center, find_minimax_center i funkcji
+    wyświetlających macierz bez ich modyfikacji.
+    
+    Obliczone wiersze są przechowywane w pamięci podręcznej LRU. Jej rozmiar jest
+    ograniczony budżetem pamięci (memory_budget, w bajtach) lub jawnie podaną
+    maksymalną liczbą wierszy (max_rows). Po przekroczeniu limitu usuwany jest
+    najdawniej używany wiersz.
+    """
+    
+    def __init__(self, graph, memory_budget=DEFAULT_MEMORY_BUDGET, max_rows=None):
+        """
+        Inicjalizuje leniwą macierz odległości dla grafu.
+        
+        Args:
+            graph: Graf wejściowy (obiekt klasy Graph)
+            memory_budget: Maksymalna liczba bajtów przeznaczona na przechowywane wiersze
+            max_rows: Maksymalna liczba przechowywanych wierszy (jeśli None, wyznaczana z memory_budget)
+        """
+        self.graph = graph
+        self.n = graph.V
+        
+        if max_rows is None:
+            row_bytes = max(1, self.n) * ROW_ENTRY_BYTES
+            max_rows = memory_budget // row_bytes
+        
+        # Zawsze przechowujemy co najmniej jeden wiersz
+        self.max_rows = max(1, max_rows)
+        self._rows = OrderedDict()
+        
+        # Statystyki pamięci podręcznej
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        """Zwraca liczbę wierszy macierzy (liczbę wierzchołków grafu)."""
+        return self.n
+    
+    def __getitem__(self, s):
+        """
+        Zwraca wiersz macierzy odległości dla wierzchołka źródłowego s.
+        
+        Jeśli wiersz nie znajduje się w pamięci podręcznej, zostaje wyznaczony
+        algorytmem Dijkstry, a w razie potrzeby usuwany jest najdawniej używany wiersz.
+        
+        Args:
+            s: Wierzchołek źródłowy (indeks)
+            
+        Returns:
+            Lista odległości od s do wszystkich wierzchołków
+        """
+        if s < 0:
+            s += self.n
+        if s < 0 or s >= self.n:
+            raise IndexError(f"Indeks wiersza musi być w zakresie 0-{self.n-1}")
+        
+        row = self._rows.get(s)
+        if row is not None:
+            self.hits += 1
+            self._rows.move_to_end(s)
+            return row
+        
+        self.misses += 1
+        row, _ = dijkstra(self.graph, s)
+        self._rows[s] = row
+        
+        # Usuń najdawniej używane wiersze, jeśli przekroczono limit
+        while len(self._rows) > self.max_rows:
+            self._rows.popitem(last=False)
+        
+        return row
+    
+    def __iter__(self):
+        """Iteruje po kolejnych wierszach macierzy (wyznaczając je na żądanie)."""
+        for s in range(self.n):
+            yield self[s]
+    
+    def cached_rows(self):
+        """Zwraca listę indeksów wierszy aktualnie przechowywanych w pamięci podręcznej."""
+        return list(self._rows.keys())
+
+def compute_distance_matrix(graph, lazy=False, memory_budget=DEFAULT_MEMORY_BUDGET, out_path=None,
+                            predecessors_path=None, block_rows=DEFAULT_BLOCK_ROWS):
     """
     Wyznacza macierz odległości dla grafu.
     
@@ -31,13 +135,43 @@ def compute_distance_matrix(graph):
     - Wykonujemy V razy algorytm Dijkstry
     - Każde wykonanie Dijkstry ma złożoność O(V² log V) dla implementacji z kolejką priorytetową
     
+    W trybie leniwym (lazy=True) żaden wiersz nie jest liczony od razu - zwracany
+    jest obiekt LazyDistanceMatrix, który wyznacza wiersze dopiero przy odwołaniu.
+    
+    Jeśli podano out_path, każdy wiersz jest zapisywany do pliku .npy zaraz po
+    wyznaczeniu (macierz nie jest przechowywana w pamięci RAM), a wynikiem jest
+    macierz mapowana z tego pliku. Ponowne wywołanie po przerwaniu obliczeń
+    wznawia je od pierwszego nieukończonego bloku wierszy.
+    
     Args:
         graph: Graf wejściowy (obiekt klasy Graph)
+        lazy: Czy zwrócić leniwą macierz odległości zamiast pełnej listy list
+        memory_budget: Budżet pamięci (w bajtach) na wiersze leniwej macierzy
+        out_path: Ścieżka pliku .npy dla macierzy odległości (opcjonalna)
+        predecessors_path: Ścieżka pliku .npy dla macierzy poprzedników (tylko z out_path)
+        block_rows: Liczba wierszy zapisywanych między aktualizacjami pliku postępu
         
     Returns:
-        Macierz odległości (lista list), gdzie macierz[i][j] to najkrótsza odległość 
-        z wierzchołka i do wierzchołka j
+        Macierz odległości (lista list, LazyDistanceMatrix lub tablica mapowana z pliku),
+        gdzie macierz[i][j] to najkrótsza odległość z wierzchołka i do wierzchołka j
     """
+    if lazy:
+        return LazyDistanceMatrix(graph, memory_budget)
+    
+    if out_path is not None:
+        # Skrót posortowanych trójek (u, v, w) pozwala wykryć próbę wznowienia dla innego grafu
+        triples = sorted((u, v, graph.get_weight(u, v)) for u, v in graph.get_edges())
+        fingerprint = data_fingerprint(np.array([(u, v) for u, v, _ in triples], dtype=np.int64),
+                                       np.array([w for _, _, w in triples], dtype=np.float64))
+        store = RowBlockStore(out_path, graph.V, block_rows, predecessors_path, fingerprint)
+        
+        for s in range(store.next_row, graph.V):
+            ds, ps = dijkstra(graph, s)
+            store.write_row(s, ds, ps)
+        
+        distance_matrix, _ = store.open_result()
+        return distance_matrix
+    
     n = graph.V
     distance_matrix = [[0] * n for _ in range(n)]
     
@@ -52,7 +186,180 @@ def compute_distance_matrix(graph):
     
     return distance_matrix
 
-def zad3(graph=None):
+class DijkstraWorkspace:
+    """
+    Wielokrotnego użytku przestrzeń robocza algorytmu Dijkstry.
+    
+    Tablice odległości i znaczników ustalenia mają długość V i są alokowane raz.
+    Zamiast zerować je przed każdym zapytaniem (koszt O(V)), każdy wpis ma znacznik
+    wersji - wpis jest ważny tylko wtedy, gdy jego wersja jest równa wersji
+    bieżącego zapytania, a rozpoczęcie nowego zapytania to zwiększenie licznika.
+    """
+    
+    def __init__(self, n):
+        """
+        Inicjalizuje przestrzeń roboczą dla grafu o n wierzchołkach.
+        
+        Args:
+            n: Liczba wierzchołków grafu
+        """
+        self.n = n
+        self.dist = [float('inf')] * n
+        self.dist_version = [0] * n
+        self.settled_version = [0] * n
+        self.version = 0
+    
+    def search(self, graph, s, targets):
+        """
+        Uruchamia algorytm Dijkstry z s i zatrzymuje go po ustaleniu wszystkich celów.
+        
+        Args:
+            graph: Graf wejściowy (obiekt klasy Graph)
+            s: Wierzchołek źródłowy
+            targets: Zbiór wierzchołków docelowych
+            
+        Returns:
+            Słownik {cel: odległość} dla osiągalnych wierzchołków docelowych
+        """
+        self.version += 1
+        version = self.version
+        dist = self.dist
+        dist_version = self.dist_version
+        settled_version = self.settled_version
+        adjacency_list = graph.get_adjacency_list()
+        
+        dist[s] = 0
+        dist_version[s] = version
+        queue = [(0, s)]
+        
+        found = {}
+        remaining = len(targets)
+        
+        while queue and remaining:
+            dist_u, u = heapq.heappop(queue)
+            
+            # Pomiń duplikaty w kolejce
+            if settled_version[u] == version:
+                continue
+            settled_version[u] = version
+            
+            if u in targets:
+                found[u] = dist_u
+                remaining -= 1
+            
+            for v in adjacency_list[u]:
+                if settled_version[v] != version:
+                    new_distance = dist_u + graph.get_weight(u, v)
+                    if dist_version[v] != version or new_distance < dist[v]:
+                        dist[v] = new_distance
+                        dist_version[v] = version
+                        heapq.heappush(queue, (new_distance, v))
+        
+        return found
+
+def compute_distance_table(graph, sources, targets, workspace=None):
+    """
+    Wyznacza tabelę odległości |S|×|T| między listą źródeł a listą celów.
+    
+    Zapytania są grupowane według źródła (każde różne źródło to jedno uruchomienie
+    algorytmu Dijkstry), wszystkie korzystają z jednej przestrzeni roboczej
+    DijkstraWorkspace (bez inicjalizacji tablic O(V) dla każdego zapytania),
+    a każde przeszukiwanie kończy się, gdy tylko ustalone zostaną wszystkie cele.
+    
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+        sources: Lista wierzchołków źródłowych
+        targets: Lista wierzchołków docelowych
+        workspace: Przestrzeń robocza do ponownego użycia (jeśli None, zostanie utworzona)
+        
+    Returns:
+        Tabela odległości (lista list), gdzie tabela[i][j] to najkrótsza odległość
+        z sources[i] do targets[j] (inf, jeśli cel jest nieosiągalny)
+    """
+    n = graph.V
+    for v in list(sources) + list(targets):
+        if v < 0 or v >= n:
+            raise ValueError(f"Indeksy wierzchołków muszą być z zakresu 0-{n-1}")
+    
+    if workspace is None:
+        workspace = DijkstraWorkspace(n)
+    
+    target_set = set(targets)
+    rows = {}
+    
+    for s in sources:
+        if s not in rows:
+            found = workspace.search(graph, s, target_set)
+            rows[s] = [found.get(t, float('inf')) for t in targets]
+    
+    return [list(rows[s]) for s in sources]
+
+def update_distance_matrix(distance_matrix, u, v, weight):
+    """
+    Aktualizuje macierz odległości po dodaniu krawędzi (u, v) lub zmniejszeniu jej wagi.
+    
+    Nowa najkrótsza ścieżka może skorzystać z krawędzi (u, v) co najwyżej raz, więc:
+        D'[i][j] = min(D[i][j], D[i][u] + w + D[v][j], D[i][v] + w + D[u][j])
+    Zamiast sprawdzać wszystkie pary, funkcja ogranicza się do:
+    - wierzchołków źródłowych i, dla których D[i][u] + w < D[i][v] (lub symetrycznie),
+    - wierzchołków docelowych j, dla których w + D[v][j] < D[u][j] (lub symetrycznie).
+    Tylko takie pary mogą ulec skróceniu, a zwykle jest ich niewiele.
+    
+    Funkcja modyfikuje macierz w miejscu. Sam graf nie jest zmieniany - krawędź
+    należy dodać (lub zmienić jej wagę w graph.weights) osobno. Zwiększenie wagi
+    krawędzi nie jest obsługiwane i wymaga ponownego obliczenia macierzy.
+    
+    Złożoność: O(V²) w najgorszym przypadku, zwykle O(V + liczba zmienionych par).
+    
+    Args:
+        distance_matrix: Macierz odległości (lista list) z compute_distance_matrix
+        u, v: Końce dodanej lub zmienionej krawędzi
+        weight: Nowa waga krawędzi (u, v)
+        
+    Returns:
+        Liczba elementów macierzy, które uległy zmianie
+    """
+    n = len(distance_matrix)
+    if u < 0 or v < 0 or u >= n or v >= n:
+        raise ValueError(f"Indeksy wierzchołków muszą być z zakresu 0-{n-1}")
+    
+    # Krawędź nie skraca nawet odległości między u i v - nic się nie zmienia
+    if distance_matrix[u][v] <= weight:
+        return 0
+    
+    # Kopie wierszy u i v sprzed aktualizacji
+    row_u = list(distance_matrix[u])
+    row_v = list(distance_matrix[v])
+    
+    # Wierzchołki docelowe, do których można dotrzeć szybciej przez krawędź u -> v lub v -> u
+    targets_via_v = [j for j in range(n) if weight + row_v[j] < row_u[j]]
+    targets_via_u = [j for j in range(n) if weight + row_u[j] < row_v[j]]
+    
+    changed = 0
+    for i in range(n):
+        row = distance_matrix[i]
+        
+        # Odległość od i do v przez u (i symetrycznie)
+        through_u = row_u[i] + weight
+        through_v = row_v[i] + weight
+        
+        if through_u < row_v[i]:
+            for j in targets_via_v:
+                candidate = through_u + row_v[j]
+                if candidate < row[j]:
+                    row[j] = candidate
+                    changed += 1
+        
+        if through_v < row_u[i]:
+            for j in targets_via_u:
+                candidate = through_v + row_u[j]
+                if candidate < row[j]:
+                    row[j] = candidate
+                    changed += 1
+    
+    return changed
+
+def zad3(graph=None, lazy=False):
     """
     Wyznacza i wyświetla macierz odległości dla grafu.
     
@@ -63,16 +370,17 @@ def zad3(graph=None):
     
     Args:
         graph: Graf wejściowy (obiekt klasy Graph, jeśli None, zostanie wygenerowany losowy graf)
+        lazy: Czy wyznaczać wiersze macierzy na żądanie (LazyDistanceMatrix)
         
     Returns:
-        Macierz odległości - lista list zawierająca najkrótsze odległości między każdą parą wierzchołków
+        Macierz odległości - lista list (lub LazyDistanceMatrix) zawierająca najkrótsze odległości między każdą parą wierzchołków
     """
     if graph is None:
         # Generuj losowy graf z 12 wierzchołkami i wagami z zakresu [1, 10]
         graph = zad1(12, 1, 10)
     
     # Oblicz macierz odległości
-    distance_matrix = compute_distance_matrix(graph)
+    distance_matrix = compute_distance_matrix(graph, lazy)
     
     # Wyświetl macierz w formacie tekstowym
     print("Macierz odległości:")
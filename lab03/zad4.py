@@ -16,9 +16,20 @@ Centrum minimax (centrum):
 - Reprezentuje wierzchołek o najmniejszej "najgorszej" odległości
 - Optymalne miejsce do umieszczenia usługi, która ma minimalizować maksymalny czas
   dotarcia do dowolnego punktu w sieci
+
+Dla dużych grafów centrum minimax można wyznaczyć dokładnie bez pełnej macierzy
+odległości - funkcja find_minimax_center_bounded ogranicza ekscentryczności
+wierzchołków z dołu i z góry i uruchamia algorytm Dijkstry tylko z niewielu
+starannie wybranych wierzchołków. Centrum grafu (medianę) można natomiast
+oszacować funkcją approximate_graph_center, która estymuje sumy odległości na
+podstawie kilku losowych wierzchołków (pivotów), a następnie dokładnie sprawdza
+najlepszych kandydatów.
 """
 
+import math
+import random
 from zad1 import zad1
+from zad2 import dijkstra
 from zad3 import compute_distance_matrix
 
 def find_graph_center(distance_matrix):
@@ -91,7 +102,184 @@ def find_minimax_center(distance_matrix):
     
     return center_vertex, min_max_distance
 
-def zad4(graph=None, distance_matrix=None):
+def find_minimax_center_bounded(graph):
+    """
+    Znajduje centrum minimax grafu bez wyznaczania pełnej macierzy odległości.
+    
+    Algorytm (w stylu BoundingDiameters Takesa i Kostersa) utrzymuje dla każdego
+    wierzchołka v dolne i górne ograniczenie jego ekscentryczności ecc(v).
+    Po uruchomieniu algorytmu Dijkstry z wierzchołka w (o ekscentryczności ecc(w))
+    z nierówności trójkąta wynika, że:
+    - ecc(v) >= max(d(w, v), ecc(w) - d(w, v))
+    - ecc(v) <= ecc(w) + d(w, v)
+    Wierzchołek, którego dolne ograniczenie przekracza najlepszą znalezioną dotąd
+    ekscentryczność, nie może być centrum i zostaje odrzucony. Kolejne źródła są
+    wybierane naprzemiennie: wierzchołek o najmniejszym dolnym ograniczeniu
+    (kandydat na centrum) i wierzchołek o największym górnym ograniczeniu
+    (wierzchołek peryferyjny, który najmocniej zawęża ograniczenia pozostałych).
+    
+    Wynik jest taki sam jak find_minimax_center(compute_distance_matrix(graph)),
+    łącznie z wyborem wierzchołka o najmniejszym indeksie przy remisie.
+    
+    Złożoność: O(k * (V+E) log V), gdzie k to liczba uruchomień algorytmu Dijkstry
+    (w praktyce zwykle kilkadziesiąt, a nie V).
+    
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+        
+    Returns:
+        Tuple (center_vertex, min_max_distance, runs): 
+        - center_vertex: indeks wierzchołka będącego centrum minimax
+        - min_max_distance: promień grafu (ekscentryczność centrum)
+        - runs: liczba wykonanych uruchomień algorytmu Dijkstry
+    """
+    n = graph.V
+    if n == 0:
+        return None, float('inf'), 0
+    
+    adjacency_list = graph.get_adjacency_list()
+    lower = [0] * n
+    upper = [float('inf')] * n
+    
+    center_vertex = None
+    min_max_distance = float('inf')
+    candidates = set(range(n))
+    runs = 0
+    
+    # Pierwsze źródło: wierzchołek o największym stopniu (zwykle blisko centrum)
+    w = max(range(n), key=lambda v: len(adjacency_list[v]))
+    pick_lower = False
+    
+    while candidates:
+        ds, _ = dijkstra(graph, w)
+        runs += 1
+        candidates.discard(w)
+        
+        eccentricity = max(ds)
+        
+        # Graf niespójny - ekscentryczność każdego wierzchołka jest nieskończona
+        if eccentricity == float('inf'):
+            return None, float('inf'), runs
+        
+        if eccentricity < min_max_distance or (eccentricity == min_max_distance and w < center_vertex):
+            min_max_distance = eccentricity
+            center_vertex = w
+        
+        # Aktualizacja ograniczeń i odrzucanie wierzchołków, które nie mogą być centrum
+        for v in list(candidates):
+            d = ds[v]
+            lower[v] = max(lower[v], d, eccentricity - d)
+            upper[v] = min(upper[v], eccentricity + d)
+            
+            if lower[v] > min_max_distance or (lower[v] == min_max_distance and v > center_vertex):
+                candidates.discard(v)
+        
+        if not candidates:
+            break
+        
+        # Wybór kolejnego źródła (naprzemiennie najmniejsze dolne i największe górne ograniczenie)
+        if pick_lower:
+            w = min(candidates, key=lambda v: (lower[v], v))
+        else:
+            w = max(candidates, key=lambda v: (upper[v], -v))
+        pick_lower = not pick_lower
+    
+    return center_vertex, min_max_distance, runs
+
+def approximate_graph_center(graph, k=64, refine=16, confidence=0.95, seed=None):
+    """
+    Szacuje centrum grafu (medianę) na podstawie k losowych pivotów.
+    
+    Algorytm:
+    1. Losujemy k wierzchołków (pivotów) i uruchamiamy z nich algorytm Dijkstry
+    2. Sumę odległości wierzchołka v szacujemy jako (n / k) * sum_{p} d(p, v)
+       (w grafie nieskierowanym d(p, v) = d(v, p))
+    3. Dla `refine` wierzchołków o najmniejszej oszacowanej sumie obliczamy sumę
+       dokładnie i wybieramy najlepszy z nich
+    
+    Ograniczenie błędu wynika z jednostronnej nierówności Hoeffdinga zastosowanej
+    do prawdziwej mediany m: z prawdopodobieństwem co najmniej `confidence` jej
+    oszacowanie nie przekracza sumy(m) + eps, gdzie
+    eps = n * diam * sqrt(ln(1 / (1 - confidence)) / (2k)), a diam <= 2 * min ecc(p)
+    ogranicza średnicę grafu. Jeśli m nie została sprawdzona dokładnie, jej
+    oszacowanie jest nie mniejsze niż największe oszacowanie T wśród sprawdzonych
+    kandydatów, więc suma(m) >= min(min_sum, T - eps).
+    
+    Złożoność: O((k + refine) * (V+E) log V) zamiast O(V * (V+E) log V) dla pełnej macierzy.
+    
+    Args:
+        graph: Graf wejściowy (obiekt klasy Graph)
+        k: Liczba losowych pivotów
+        refine: Liczba najlepszych kandydatów, których suma odległości jest liczona dokładnie
+        confidence: Poziom ufności ograniczenia błędu (z przedziału (0, 1))
+        seed: Ziarno generatora liczb losowych (dla powtarzalności wyników)
+        
+    Returns:
+        Tuple (center_vertex, min_sum, error_bound): 
+        - center_vertex: indeks wierzchołka wybranego jako centrum grafu
+        - min_sum: dokładna suma odległości od center_vertex do wszystkich wierzchołków
+        - error_bound: górne ograniczenie (min_sum - optimum) / optimum, prawdziwe
+          z prawdopodobieństwem co najmniej `confidence` (0.0 oznacza wynik dokładny)
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("Poziom ufności musi być z zakresu (0, 1)")
+    
+    n = graph.V
+    if n == 0:
+        return None, float('inf'), 0.0
+    
+    k = max(1, min(k, n))
+    rng = random.Random(seed)
+    pivots = rng.sample(range(n), k)
+    
+    # Suma odległości od pivotów do każdego wierzchołka
+    accumulated = [0] * n
+    exact_sums = {}
+    diameter_bound = float('inf')
+    
+    for p in pivots:
+        ds, _ = dijkstra(graph, p)
+        eccentricity = max(ds)
+        
+        # Graf niespójny - suma odległości każdego wierzchołka jest nieskończona
+        if eccentricity == float('inf'):
+            return None, float('inf'), 0.0
+        
+        diameter_bound = min(diameter_bound, 2 * eccentricity)
+        exact_sums[p] = sum(ds)
+        for v in range(n):
+            accumulated[v] += ds[v]
+    
+    estimates = [accumulated[v] * n / k for v in range(n)]
+    
+    # Dokładne sprawdzenie najlepszych kandydatów
+    order = sorted(range(n), key=lambda v: (estimates[v], v))
+    refined = order[:max(1, refine)]
+    for v in refined:
+        if v not in exact_sums:
+            ds, _ = dijkstra(graph, v)
+            exact_sums[v] = sum(ds)
+    
+    center_vertex = min(exact_sums, key=lambda v: (exact_sums[v], v))
+    min_sum = exact_sums[center_vertex]
+    
+    # Wszystkie sumy znane dokładnie - wynik jest dokładny
+    if len(exact_sums) == n:
+        return center_vertex, min_sum, 0.0
+    
+    # Dolne ograniczenie sumy prawdziwej mediany (z prawdopodobieństwem >= confidence)
+    epsilon = n * diameter_bound * math.sqrt(math.log(1 / (1 - confidence)) / (2 * k))
+    threshold = estimates[refined[-1]]
+    optimum_lower_bound = min(min_sum, threshold - epsilon)
+    
+    if optimum_lower_bound <= 0:
+        error_bound = 0.0 if min_sum == 0 else float('inf')
+    else:
+        error_bound = (min_sum - optimum_lower_bound) / optimum_lower_bound
+    
+    return center_vertex, min_sum, error_bound
+
+def zad4(graph=None, distance_matrix=None, lazy=False, approximate=False):
     """
     Wyznacza centrum grafu i centrum minimax.
     
@@ -109,6 +297,10 @@ def zad4(graph=None, distance_matrix=None):
         graph: Graf wejściowy (obiekt klasy Graph, jeśli None i distance_matrix jest None, 
                zostanie wygenerowany losowy graf)
         distance_matrix: Macierz odległości (jeśli None, zostanie obliczona)
+        lazy: Czy obliczana macierz odległości ma być leniwa (wiersze wyznaczane na żądanie)
+        approximate: Czy wyznaczyć centra bez macierzy odległości - medianę przybliżoną
+                     (approximate_graph_center), a centrum minimax dokładnie metodą
+                     ograniczania ekscentryczności (find_minimax_center_bounded)
         
     Returns:
         Tuple (center, minimax_center): 
@@ -119,8 +311,21 @@ def zad4(graph=None, distance_matrix=None):
         if graph is None:
             # Generuj losowy graf z 12 wierzchołkami i wagami z zakresu [1, 10]
             graph = zad1(12, 1, 10)
+        
+        if approximate:
+            # Wyznacz centra bez pełnej macierzy odległości
+            center, min_sum, error_bound = approximate_graph_center(graph)
+            print(f"Centrum grafu (mediana, przybliżone) = {center} (suma odległości: {min_sum}, "
+                  f"błąd względny <= {error_bound:.2%})")
+            
+            minimax_center, min_max_distance, runs = find_minimax_center_bounded(graph)
+            print(f"Centrum minimax (centrum) = {minimax_center} (odległość od najdalszego: {min_max_distance}, "
+                  f"uruchomienia Dijkstry: {runs})")
+            
+            return center, minimax_center
+        
         # Oblicz macierz odległości używając algorytmu z zadania 3
-        distance_matrix = compute_distance_matrix(graph)
+        distance_matrix = compute_distance_matrix(graph, lazy)
     
     # Znajdź centrum grafu (medianę)
     center, min_sum = find_graph_center(distance_matrix)
@@ -2,51 +2,73 @@
 Zadanie 5: Wyznaczanie minimalnego drzewa rozpinającego.
 """
 
+import heapq
 from zad1 import zad1
 from graph_representation import Graph
 from graph_visualization import visualize_graph
 
-def prim_mst(graph):
+def prim_mst_heap(graph):
     """
-    Algorytm Prima do znajdowania minimalnego drzewa rozpinającego.
+    Algorytm Prima z kolejką priorytetową (kopcem) do znajdowania minimalnego lasu rozpinającego.
+    
+    Z kopca pobierana jest najlżejsza krawędź prowadząca do wierzchołka spoza drzewa
+    (krawędzie do wierzchołków już dołączonych są pomijane przy pobraniu). Gdy kopiec
+    się opróżni, a nie wszystkie wierzchołki zostały dołączone, graf jest niespójny -
+    budowa drzewa zaczyna się od kolejnego nieodwiedzonego wierzchołka, więc wynikiem
+    jest minimalny las rozpinający (drzewo dla każdej spójnej składowej).
+    
+    Złożoność: O(E log V).
     
     Args:
         graph: Graf wejściowy
         
     Returns:
-        Lista krawędzi należących do MST
+        Tuple (mst_edges, total_weight): lista krawędzi (u, v) z u < v oraz suma ich wag
     """
     n = graph.V
+    adjacency_list = graph.get_adjacency_list()
     
-    # Inicjalizacja zbioru wierzchołków w MST i zbioru krawędzi MST
-    vertices_in_mst = {0}  # Zaczynamy od wierzchołka 0
+    in_mst = [False] * n
     mst_edges = []
+    total_weight = 0
     
-    # Dopóki nie dodamy wszystkich wierzchołków do MST
-    while len(vertices_in_mst) < n:
-        min_weight = float('inf')
-        min_edge = None
+    for root in range(n):
+        if in_mst[root]:
+            continue
         
-        # Dla każdej krawędzi (u, v) gdzie u jest w MST, a v nie jest
-        for u in vertices_in_mst:
-            for v in range(n):
-                if v not in vertices_in_mst:
-                    edge = (min(u, v), max(u, v))
-                    if edge in graph.get_weights():
-                        weight = graph.get_weight(u, v)
-                        if weight < min_weight:
-                            min_weight = weight
-                            min_edge = edge
+        # Nowe drzewo lasu rozpinającego - kolejna spójna składowa
+        in_mst[root] = True
+        queue = [(graph.get_weight(root, v), root, v) for v in adjacency_list[root]]
+        heapq.heapify(queue)
         
-        # Jeśli nie znaleziono żadnej krawędzi, graf nie jest spójny
-        if min_edge is None:
-            break
-        
-        # Dodaj krawędź do MST i dodaj nowy wierzchołek do zbioru
-        mst_edges.append(min_edge)
-        vertices_in_mst.add(min_edge[0])
-        vertices_in_mst.add(min_edge[1])
+        while queue:
+            weight, u, v = heapq.heappop(queue)
+            if in_mst[v]:
+                continue
+            
+            in_mst[v] = True
+            mst_edges.append((min(u, v), max(u, v)))
+            total_weight += weight
+            
+            for x in adjacency_list[v]:
+                if not in_mst[x]:
+                    heapq.heappush(queue, (graph.get_weight(v, x), v, x))
+    
+    return mst_edges, total_weight
+
+def prim_mst(graph):
+    """
+    Algorytm Prima do znajdowania minimalnego drzewa rozpinającego.
+    
+    Dla grafu niespójnego zwraca minimalny las rozpinający (zob. prim_mst_heap).
     
+    Args:
+        graph: Graf wejściowy
+        
+    Returns:
+        Lista krawędzi należących do MST
+    """
+    mst_edges, _ = prim_mst_heap(graph)
     return mst_edges
 
 class DisjointSet:
@@ -57,9 +79,15 @@ class DisjointSet:
         self.rank = [0] * n
     
     def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # Kompresja ścieżki
-        return self.parent[x]
+        # Iteracyjnie - rekurencja przekracza limit dla długich łańcuchów
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        
+        # Kompresja ścieżki
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
     
     def union(self, x, y):
         root_x = self.find(x)
@@ -0,0 +1,217 @@
+"""
+Planer algorytmu wyznaczania najkrótszych ścieżek między wszystkimi parami wierzchołków.
+
+Na podstawie liczby wierzchołków i krawędzi oraz znaków wag planer szacuje koszt
+dostępnych strategii i wybiera najtańszą:
+- algorytm Floyda-Warshalla - O(V³), rozważany tylko dla grafów gęstych
+  (gęstość co najmniej DENSE_GRAPH_MIN_DENSITY),
+- wielokrotny algorytm Dijkstry - O(V (V+E) log V), tylko dla nieujemnych wag
+  (bez fazy Bellmana-Forda),
+- algorytm Johnsona - Bellman-Ford O(VE) i wielokrotny Dijkstra, dla ujemnych wag.
+Wybierane jest też środowisko wykonania: czysty Python, NumPy (wektorowy
+Floyd-Warshall) lub pula procesów (równoległe uruchomienia algorytmu Dijkstry).
+"""
+
+import math
+import numpy as np
+from lab04.csr_graph import CSRGraph
+from lab04.johnson import johnson, dijkstra_rows
+
+# Względny koszt jednej elementarnej operacji (jednostka: krok algorytmu Dijkstry
+# z kolejką priorytetową w Pythonie). Wartości wyznaczone z pomiarów na losowych
+# grafach (dijkstra_rows, floyd_warshall, floyd_warshall_numpy):
+# - Dijkstra: ok. 1-2.4e-8 s na jednostkę V (V+E) log V (V = 300-1000, E = 5V-200V),
+# - Floyd-Warshall w Pythonie: ok. 4.7e-8 s na jednostkę V³ (V = 150), czyli ok. 2 kroki Dijkstry,
+# - Floyd-Warshall w NumPy: ok. 2.5-2.9e-9 s na jednostkę V³ (V = 500-1000), ok. 0.12 kroku
+PYTHON_OP_COST = 1.0
+PYTHON_FLOYD_WARSHALL_OP_COST = 2.0
+NUMPY_OP_COST = 0.12
+
+# Minimalna gęstość grafu E / (V (V-1)), od której rozważany jest algorytm Floyda-Warshalla.
+# Dla mniejszych grafów wektorowy Floyd-Warshall bywa szybszy mimo małej gęstości
+# (np. V = 200, E = 1000: 0.03 s wobec 0.08 s), ale jego koszt O(V³) rośnie szybciej
+# niż O(V (V+E) log V) wielokrotnego algorytmu Dijkstry, więc grafy rzadkie są zawsze
+# kierowane do algorytmu Dijkstry lub Johnsona.
+DENSE_GRAPH_MIN_DENSITY = 0.1
+
+# Liczba wierzchołków, od której opłaca się uruchamianie puli procesów
+PROCESS_POOL_MIN_VERTICES = 500
+
+# Maksymalna liczba wierzchołków dla wektorowego Floyda-Warshalla (macierz V×V w pamięci)
+NUMPY_MAX_VERTICES = 20000
+
+def floyd_warshall(digraph):
+    """
+    Algorytm Floyda-Warshalla w czystym Pythonie.
+
+    Args:
+        digraph: DiGraph (lub Graph z lab03, lub CSRGraph) - graf z wagami
+
+    Returns:
+        Macierz odległości (lista list) lub None, jeśli graf zawiera cykl o ujemnej sumie wag
+    """
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    n = csr.V
+    indptr, indices, weights = csr.to_lists()
+
+    D = [[float('inf')] * n for _ in range(n)]
+    for u in range(n):
+        D[u][u] = 0
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if weights[k] < D[u][v]:
+                D[u][v] = weights[k]
+
+    for k in range(n):
+        row_k = D[k]
+        for i in range(n):
+            row_i = D[i]
+            d_ik = row_i[k]
+            if d_ik == float('inf'):
+                continue
+            for j in range(n):
+                candidate = d_ik + row_k[j]
+                if candidate < row_i[j]:
+                    row_i[j] = candidate
+
+    if any(D[i][i] < 0 for i in range(n)):
+        return None
+
+    return D
+
+def floyd_warshall_numpy(digraph):
+    """
+    Wektorowy algorytm Floyda-Warshalla (NumPy) - dla każdego k jedna operacja na całej macierzy.
+
+    Args:
+        digraph: DiGraph (lub Graph z lab03, lub CSRGraph) - graf z wagami
+
+    Returns:
+        Macierz odległości (lista list) lub None, jeśli graf zawiera cykl o ujemnej sumie wag
+    """
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    n = csr.V
+
+    D = np.full((n, n), np.inf)
+    np.minimum.at(D, (csr.edge_sources(), csr.indices), csr.weights.astype(np.float64))
+    np.fill_diagonal(D, np.minimum(np.diag(D), 0))
+
+    for k in range(n):
+        np.minimum(D, D[:, k, None] + D[None, k, :], out=D)
+
+    if n and np.diag(D).min() < 0:
+        return None
+
+    return _to_lists(D, csr.has_integer_weights())
+
+def _to_lists(D, integer_weights):
+    """Zamienia macierz NumPy na listę list (z liczbami całkowitymi dla całkowitych wag)."""
+    rows = D.tolist()
+    if integer_weights:
+        rows = [[int(d) if d != float('inf') else d for d in row] for row in rows]
+    return rows
+
+def _repeated_dijkstra(csr, workers=None):
+    """Wielokrotny algorytm Dijkstry (bez fazy Bellmana-Forda) dla nieujemnych wag."""
+    n = csr.V
+    D = [None] * n
+    for u, ds, _ in dijkstra_rows(csr, workers):
+        D[u] = ds
+    return D
+
+def estimate_costs(n, m, has_negative_weights, workers=None):
+    """
+    Szacuje koszt (w umownych operacjach elementarnych) dostępnych strategii.
+
+    Args:
+        n: Liczba wierzchołków
+        m: Liczba krawędzi
+        has_negative_weights: Czy graf ma krawędzie o ujemnych wagach
+        workers: Liczba dostępnych procesów roboczych
+
+    Returns:
+        Słownik {(algorytm, środowisko): szacowany koszt}
+    """
+    costs = {}
+    parallel = workers is not None and workers > 1 and n >= PROCESS_POOL_MIN_VERTICES
+    density = m / (n * (n - 1)) if n > 1 else 0.0
+
+    if density >= DENSE_GRAPH_MIN_DENSITY:
+        costs[('floyd_warshall', 'python')] = n ** 3 * PYTHON_FLOYD_WARSHALL_OP_COST
+        if n <= NUMPY_MAX_VERTICES:
+            costs[('floyd_warshall', 'numpy')] = n ** 3 * NUMPY_OP_COST + n * PYTHON_OP_COST
+
+    dijkstra_cost = n * (n + m) * math.log2(n + 2) * PYTHON_OP_COST
+    # Bellman-Ford z wczesnym zakończeniem - w praktyce kilka przebiegów, w najgorszym razie n
+    bellman_ford_cost = m * n * PYTHON_OP_COST
+
+    if not has_negative_weights:
+        costs[('dijkstra', 'python')] = dijkstra_cost
+        if parallel:
+            costs[('dijkstra', 'process_pool')] = dijkstra_cost / workers
+
+    costs[('johnson', 'python')] = bellman_ford_cost + dijkstra_cost
+    if parallel:
+        costs[('johnson', 'process_pool')] = bellman_ford_cost + dijkstra_cost / workers
+
+    return costs
+
+def plan_all_pairs(graph, workers=None):
+    """
+    Wybiera najtańszą strategię wyznaczania najkrótszych ścieżek między wszystkimi parami.
+
+    Args:
+        graph: DiGraph, Graph z lab03 lub CSRGraph
+        workers: Liczba dostępnych procesów roboczych (None - bez puli procesów)
+
+    Returns:
+        Tuple (csr, plan): csr - graf w formacie CSR, plan - słownik z kluczami
+            'algorithm', 'backend', 'estimated_cost', 'density',
+            'negative_weights', 'costs' (koszty wszystkich rozważanych strategii)
+            oraz 'summary' (opis wyboru do wypisania)
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_digraph(graph)
+    n, m = csr.V, csr.E
+    has_negative_weights = bool(m and csr.weights.min() < 0)
+
+    costs = estimate_costs(n, m, has_negative_weights, workers)
+    (algorithm, backend), cost = min(costs.items(), key=lambda item: item[1])
+
+    plan = {
+        'algorithm': algorithm,
+        'backend': backend,
+        'estimated_cost': cost,
+        'density': m / (n * (n - 1)) if n > 1 else 0.0,
+        'negative_weights': has_negative_weights,
+        'costs': costs,
+    }
+    plan['summary'] = (f"Wybrany algorytm: {algorithm} ({backend}), "
+                       f"szacowany koszt: {cost:.3g}, gęstość: {plan['density']:.3f}, "
+                       f"ujemne wagi: {'tak' if has_negative_weights else 'nie'}")
+    return csr, plan
+
+def all_pairs_shortest_paths(graph, workers=None):
+    """
+    Wyznacza macierz odległości między wszystkimi parami wierzchołków najtańszą strategią.
+
+    Args:
+        graph: DiGraph, Graph z lab03 lub CSRGraph
+        workers: Liczba dostępnych procesów roboczych (None - bez puli procesów)
+
+    Returns:
+        Tuple (D, plan): D - macierz odległości (lista list) lub None, jeśli graf
+            zawiera cykl o ujemnej sumie wag; plan - słownik opisujący wybór (plan_all_pairs),
+            plan['summary'] zawiera opis wybranej strategii
+    """
+    csr, plan = plan_all_pairs(graph, workers)
+    algorithm, backend = plan['algorithm'], plan['backend']
+    pool_workers = workers if backend == 'process_pool' else None
+
+    if algorithm == 'floyd_warshall':
+        D = floyd_warshall_numpy(csr) if backend == 'numpy' else floyd_warshall(csr)
+    elif algorithm == 'dijkstra':
+        D = _repeated_dijkstra(csr, pool_workers)
+    else:
+        D = johnson(csr, pool_workers)
+
+    return D, plan
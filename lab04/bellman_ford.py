@@ -1,9 +1,17 @@
 """
 Implementacja algorytmu Bellmana-Forda do znajdowania najkrótszych ścieżek w grafie skierowanym.
 Ten algorytm może obsługiwać krawędzie o ujemnych wagach i wykrywać cykle o ujemnej sumie wag.
+
+Dostępne są dwa warianty:
+- bellman_ford - przebiegi po wszystkich krawędziach, domyślnie kończone wcześniej,
+  gdy w przebiegu żadna odległość się nie zmieniła,
+- spfa - wariant kolejkowy (Shortest Path Faster Algorithm), który relaksuje tylko
+  krawędzie wychodzące z wierzchołków, których odległość się zmieniła.
+Dla grafów acyklicznych bellman_ford korzysta z jednego przebiegu w porządku
+topologicznym (dag_shortest_paths).
 """
 
-from lab04.digraph_representation import DiGraph
+from collections import deque
 
 def init(digraph, s):
     """
@@ -42,13 +50,85 @@ def relax(u, v, w, ds, ps):
         return True
     return False
 
-def bellman_ford(digraph, s):
+def topological_order(digraph):
+    """
+    Wyznacza porządek topologiczny digrafu algorytmem Kahna (iteracyjnie).
+    
+    Wierzchołki o stopniu wejściowym 0 są kolejno usuwane z grafu; jeśli nie
+    da się usunąć wszystkich, pozostałe wierzchołki leżą na cyklach lub są
+    osiągalne z cykli.
+    
+    Args:
+        digraph: DiGraph - graf skierowany
+        
+    Returns:
+        Lista wierzchołków w porządku topologicznym lub None, jeśli graf zawiera cykl
+    """
+    n = digraph.V
+    in_degree = [0] * n
+    for _, v in digraph.get_edges():
+        in_degree[v] += 1
+    
+    order = [v for v in range(n) if in_degree[v] == 0]
+    for u in order:
+        for v in digraph.get_out_neighbors(u):
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                order.append(v)
+    
+    return order if len(order) == n else None
+
+def dag_shortest_paths(digraph, s, order=None):
+    """
+    Najkrótsze ścieżki od wierzchołka s w grafie acyklicznym (DAG), również dla ujemnych wag.
+    
+    Wierzchołki są przetwarzane w porządku topologicznym, więc w chwili relaksacji
+    krawędzi wychodzących z u odległość do u jest już ostateczna - wystarcza jedna
+    relaksacja każdej krawędzi. Złożoność: O(V + E).
+    
+    Args:
+        digraph: DiGraph - graf skierowany acykliczny z wagami
+        s: Wierzchołek źródłowy
+        order: Porządek topologiczny (jeśli None, zostanie wyznaczony)
+        
+    Returns:
+        Tuple (ds, ps, has_negative_cycle): jak w bellman_ford (has_negative_cycle zawsze False)
+    """
+    if order is None:
+        order = topological_order(digraph)
+        if order is None:
+            raise ValueError("Graf zawiera cykl - nie istnieje porządek topologiczny")
+    
+    ds, ps = init(digraph, s)
+    
+    # Wierzchołki przed s w porządku topologicznym są z s nieosiągalne
+    for u in order[order.index(s):]:
+        if ds[u] == float('inf'):
+            continue
+        for v in digraph.get_out_neighbors(u):
+            relax(u, v, digraph.get_weight(u, v), ds, ps)
+    
+    return ds, ps, False
+
+def bellman_ford(digraph, s, early_exit=True, dag_check=True):
     """
     Algorytm Bellmana-Forda do znajdowania najkrótszych ścieżek od wierzchołka s.
     
+    Jeśli graf jest acykliczny (dag_check=True i istnieje porządek topologiczny),
+    najkrótsze ścieżki są wyznaczane jednym przebiegiem w porządku topologicznym
+    (dag_shortest_paths) - odległości są takie same, ale przy kilku najkrótszych
+    ścieżkach tej samej długości poprzednik może się różnić.
+    
+    Wagi krawędzi są pobierane z grafu raz, przed pierwszym przebiegiem. Jeśli
+    w przebiegu żadna odległość się nie zmieniła, kolejne przebiegi też niczego
+    nie zmienią, więc przy early_exit=True algorytm kończy się wcześniej -
+    wynik (ds, ps) jest identyczny jak po wszystkich n-1 przebiegach.
+    
     Args:
         digraph: DiGraph - graf skierowany z wagami
         s: Wierzchołek źródłowy
+        early_exit: Czy zakończyć przebiegi, gdy odległości przestaną się zmieniać
+        dag_check: Czy sprawdzić acykliczność grafu i użyć szybkiej ścieżki dla DAG
         
     Returns:
         Tuple (ds, ps, has_negative_cycle): 
@@ -56,24 +136,92 @@ def bellman_ford(digraph, s):
             ps - tablica poprzedników
             has_negative_cycle - czy wykryto cykl o ujemnej sumie wag osiągalny z s
     """
+    # Graf acykliczny - jeden przebieg w porządku topologicznym, O(V + E)
+    if dag_check:
+        order = topological_order(digraph)
+        if order is not None:
+            return dag_shortest_paths(digraph, s, order)
+    
     # Inicjalizacja
     n = digraph.V
     ds, ps = init(digraph, s)
+    edges = [(u, v, digraph.get_weight(u, v)) for u, v in digraph.get_edges()]
     
     # Relaksacja każdej krawędzi n-1 razy
     for i in range(n - 1):
-        for u, v in digraph.get_edges():
-            w = digraph.get_weight(u, v)
-            relax(u, v, w, ds, ps)
+        changed = False
+        for u, v, w in edges:
+            if relax(u, v, w, ds, ps):
+                changed = True
+        
+        # Odległości się ustabilizowały - nie ma cyklu o ujemnej sumie wag osiągalnego z s
+        if early_exit and not changed:
+            return ds, ps, False
     
     # Sprawdzenie, czy istnieje cykl o ujemnej sumie wag
-    for u, v in digraph.get_edges():
-        w = digraph.get_weight(u, v)
+    for u, v, w in edges:
         if ds[v] > ds[u] + w:
             return ds, ps, True  # Znaleziono cykl o ujemnej sumie wag
     
     return ds, ps, False
 
+def spfa(digraph, s):
+    """
+    Kolejkowy wariant algorytmu Bellmana-Forda (SPFA) od wierzchołka s.
+    
+    Kolejka FIFO zawiera wierzchołki, których odległość zmniejszyła się od czasu
+    ostatniego przetworzenia - tylko ich krawędzie wychodzące są relaksowane.
+    Dla każdego wierzchołka pamiętana jest liczba krawędzi na bieżącej ścieżce
+    z s; najkrótsza ścieżka ma co najwyżej n-1 krawędzi, więc ścieżka z n
+    krawędziami oznacza cykl o ujemnej sumie wag osiągalny z s.
+    
+    Odległości są takie same jak w bellman_ford; przy kilku najkrótszych ścieżkach
+    tej samej długości poprzednik może się różnić. Po wykryciu cyklu o ujemnej
+    sumie wag zwracany jest stan z chwili wykrycia.
+    
+    Złożoność: O(VE) w najgorszym przypadku, zwykle bliska O(E).
+    
+    Args:
+        digraph: DiGraph - graf skierowany z wagami
+        s: Wierzchołek źródłowy
+        
+    Returns:
+        Tuple (ds, ps, has_negative_cycle): jak w bellman_ford
+    """
+    n = digraph.V
+    ds, ps = init(digraph, s)
+    
+    # Lista sąsiedztwa z wagami - bez wyszukiwania wag w słowniku przy każdej relaksacji
+    out_edges = [[(v, digraph.get_weight(u, v)) for v in digraph.get_out_neighbors(u)] for u in range(n)]
+    
+    # Liczba krawędzi na bieżącej najkrótszej ścieżce od s
+    lengths = [0] * n
+    in_queue = [False] * n
+    
+    queue = deque([s])
+    in_queue[s] = True
+    
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        dist_u = ds[u]
+        
+        for v, w in out_edges[u]:
+            if ds[v] > dist_u + w:
+                ds[v] = dist_u + w
+                ps[v] = u
+                lengths[v] = lengths[u] + 1
+                
+                # Ścieżka z n krawędziami musi zawierać cykl o ujemnej sumie wag
+                if lengths[v] >= n:
+                    return ds, ps, True
+                
+                if not in_queue[v]:
+                    queue.append(v)
+                    in_queue[v] = True
+    
+    return ds, ps, False
+
 def get_path(ps, s, v):
     """
     Odtwarza ścieżkę od wierzchołka s do v na podstawie tablicy poprzedników.
@@ -99,34 +247,103 @@ def get_path(ps, s, v):
     
     return None
 
-def has_negative_cycle(digraph):
+def detect_negative_cycle(digraph):
     """
-    Sprawdza, czy digraf zawiera cykl o ujemnej sumie wag.
+    Znajduje cykl o ujemnej sumie wag algorytmem Bellmana-Forda z rozbiorem poddrzew (Tarjan).
+    
+    Algorytm działa tak jak kolejkowy Bellman-Ford z wirtualnego źródła połączonego
+    krawędziami o wadze 0 ze wszystkimi wierzchołkami (graf poszerzony nie jest
+    budowany - wszystkie odległości startują od 0). Utrzymywane jest drzewo
+    najkrótszych ścieżek; gdy odległość do v maleje po relaksacji krawędzi (u, v):
+    - jeśli u należy do poddrzewa v, krawędź (u, v) zamyka cykl w drzewie,
+      a cykl ten ma ujemną sumę wag - algorytm kończy się od razu,
+    - w przeciwnym razie wszyscy potomkowie v są odłączani od drzewa i nie są
+      przetwarzani, dopóki ich odległość ponownie się nie zmniejszy (ich
+      odległości i tak są nieaktualne).
+    Cykl jest więc wykrywany w jednym przebiegu, bez czekania na n przebiegów.
+    
+    Złożoność: O(VE) w najgorszym przypadku, zwykle znacznie mniej.
     
     Args:
         digraph: DiGraph - graf skierowany z wagami
         
     Returns:
-        bool: True jeśli istnieje cykl o ujemnej sumie wag, False w przeciwnym razie
+        Tuple (cycle, weight): cycle - lista wierzchołków cyklu o ujemnej sumie wag
+            (pierwszy wierzchołek powtórzony na końcu), weight - suma wag krawędzi cyklu;
+            (None, None), jeśli graf nie zawiera cyklu o ujemnej sumie wag
     """
-    # Dodaj dodatkowy wierzchołek s połączony z wszystkimi innymi
     n = digraph.V
-    extended_digraph = DiGraph(n + 1)
+    out_edges = [[(v, digraph.get_weight(u, v)) for v in digraph.get_out_neighbors(u)] for u in range(n)]
     
-    # Kopiuj wszystkie istniejące krawędzie
-    for u, v in digraph.get_edges():
-        weight = digraph.get_weight(u, v)
-        extended_digraph.add_edge(u, v, weight)
+    ds = [0] * n
+    parents = [None] * n  # None - wierzchołek jest dzieckiem wirtualnego źródła
+    children = [set() for _ in range(n)]
+    active = [True] * n   # False - wierzchołek odłączony wraz z poddrzewem
+    in_queue = [True] * n
+    queue = deque(range(n))
     
-    # Dodaj krawędzie od s (nowy wierzchołek n) do wszystkich innych
-    s = n
-    for v in range(n):
-        extended_digraph.add_edge(s, v, 0)
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        if not active[u]:
+            continue
+        
+        dist_u = ds[u]
+        for v, w in out_edges[u]:
+            if ds[v] <= dist_u + w:
+                continue
+            
+            # Poddrzewo v zawierające u oznacza cykl o ujemnej sumie wag
+            subtree = [v]
+            for x in subtree:
+                if x == u:
+                    return _tree_cycle(digraph, parents, u, v)
+                subtree.extend(children[x])
+            
+            # Odłącz potomków v od drzewa
+            for x in subtree:
+                if x != v:
+                    parents[x] = None
+                    active[x] = False
+                children[x] = set()
+            
+            if parents[v] is not None:
+                children[parents[v]].discard(v)
+            
+            ds[v] = dist_u + w
+            parents[v] = u
+            children[u].add(v)
+            active[v] = True
+            
+            if not in_queue[v]:
+                queue.append(v)
+                in_queue[v] = True
     
-    # Uruchom Bellmana-Forda od s
-    _, _, has_cycle = bellman_ford(extended_digraph, s)
+    return None, None
+
+def _tree_cycle(digraph, parents, u, v):
+    """Odtwarza cykl zamknięty krawędzią (u, v): ścieżka v -> ... -> u w drzewie i krawędź (u, v)."""
+    path = [u]
+    while path[-1] != v:
+        path.append(parents[path[-1]])
+    path.reverse()
     
-    return has_cycle
+    cycle = path + [v]
+    weight = sum(digraph.get_weight(a, b) for a, b in zip(cycle, cycle[1:]))
+    return cycle, weight
+
+def has_negative_cycle(digraph):
+    """
+    Sprawdza, czy digraf zawiera cykl o ujemnej sumie wag.
+    
+    Args:
+        digraph: DiGraph - graf skierowany z wagami
+        
+    Returns:
+        bool: True jeśli istnieje cykl o ujemnej sumie wag, False w przeciwnym razie
+    """
+    cycle, _ = detect_negative_cycle(digraph)
+    return cycle is not None
 
 def find_negative_cycle(digraph):
     """
@@ -138,48 +355,5 @@ def find_negative_cycle(digraph):
     Returns:
         Lista wierzchołków tworzących cykl o ujemnej sumie wag lub None, jeśli taki cykl nie istnieje
     """
-    n = digraph.V
-    
-    # Dla każdego wierzchołka jako źródła
-    for s in range(n):
-        # Inicjalizacja
-        ds, ps = init(digraph, s)
-        
-        # Relaksacja każdej krawędzi n-1 razy
-        for i in range(n - 1):
-            for u, v in digraph.get_edges():
-                w = digraph.get_weight(u, v)
-                relax(u, v, w, ds, ps)
-        
-        # Sprawdzenie, czy istnieje cykl o ujemnej sumie wag
-        for u, v in digraph.get_edges():
-            w = digraph.get_weight(u, v)
-            if ds[v] > ds[u] + w:
-                # Znaleziono krawędź w cyklu o ujemnej sumie wag
-                # Znajdź cykl poprzez śledzenie poprzedników
-                cycle = []
-                visited = [False] * n
-                
-                # Zaczynamy od v i śledzimy poprzedników
-                current = v
-                while not visited[current]:
-                    visited[current] = True
-                    cycle.append(current)
-                    current = ps[current]
-                    
-                    # Jeśli doszliśmy do None, to nie ma cyklu
-                    if current is None:
-                        break
-                
-                # Jeśli znaleźliśmy cykl, odwróć go i zwróć
-                if current is not None:
-                    # Znajdź indeks current w cycle
-                    start_idx = cycle.index(current)
-                    
-                    # Wydobądź cykl (od startu do końca) i odwróć go
-                    negative_cycle = cycle[start_idx:] + [current]
-                    negative_cycle.reverse()
-                    
-                    return negative_cycle
-    
-    return None 
\ No newline at end of file
+    cycle, _ = detect_negative_cycle(digraph)
+    return cycle
@@ -0,0 +1,99 @@
+"""
+Wektorowa (NumPy) implementacja algorytmu Bellmana-Forda.
+
+Krawędzie są przechowywane jako trzy tablice NumPy (źródła, cele, wagi), a każdy
+przebieg relaksacji to kilka operacji na całych tablicach:
+1. Pobranie odległości źródeł wszystkich krawędzi i wyznaczenie kandydatów dist[u] + w
+2. Wybór najmniejszego kandydata dla każdego wierzchołka docelowego (np.minimum.at)
+3. Aktualizacja odległości i poprzedników wierzchołków, których odległość się zmniejszyła
+
+Wszystkie krawędzie przebiegu korzystają z odległości sprzed przebiegu, więc po
+k przebiegach dist[v] jest długością najkrótszej ścieżki o co najwyżej k krawędziach.
+Przebiegi kończą się, gdy żadna odległość się nie zmienia.
+"""
+
+import numpy as np
+from lab04.csr_graph import CSRGraph
+
+def relaxation_passes(sources, targets, weights, dist, pred=None, max_passes=None):
+    """
+    Wykonuje wektorowe przebiegi relaksacji wszystkich krawędzi, aż odległości przestaną się zmieniać.
+
+    Tablice dist i pred są modyfikowane w miejscu.
+
+    Args:
+        sources: Tablica wierzchołków źródłowych krawędzi
+        targets: Tablica wierzchołków docelowych krawędzi
+        weights: Tablica wag krawędzi
+        dist: Tablica odległości (float64, np.inf dla nieosiągniętych wierzchołków)
+        pred: Tablica poprzedników (int64, -1 dla braku) lub None, jeśli nie są potrzebne
+        max_passes: Maksymalna liczba przebiegów (None - do ustabilizowania odległości)
+
+    Returns:
+        Tuple (passes, converged): liczba wykonanych przebiegów (łącznie z ostatnim,
+            który niczego nie zmienił) i informacja, czy odległości się ustabilizowały
+    """
+    passes = 0
+    while max_passes is None or passes < max_passes:
+        passes += 1
+
+        candidates = dist[sources] + weights
+        better = candidates < dist[targets]
+        if not better.any():
+            return passes, True
+
+        improved_targets = targets[better]
+        improved_candidates = candidates[better]
+
+        # Najmniejszy kandydat dla każdego wierzchołka docelowego
+        best = dist.copy()
+        np.minimum.at(best, improved_targets, improved_candidates)
+
+        if pred is not None:
+            # Poprzednikiem jest źródło dowolnej krawędzi, która dała najmniejszego kandydata
+            winners = improved_candidates == best[improved_targets]
+            pred[improved_targets[winners]] = sources[better][winners]
+
+        dist[:] = best
+
+    return passes, False
+
+def bellman_ford_numpy(digraph, s):
+    """
+    Wektorowy algorytm Bellmana-Forda od wierzchołka s.
+
+    Zwraca wynik w tym samym formacie co lab04.bellman_ford.bellman_ford. Odległości
+    są takie same; przy kilku najkrótszych ścieżkach tej samej długości wybrany
+    poprzednik może się różnić, ale zawsze wyznacza najkrótszą ścieżkę.
+    Jeśli wykryto cykl o ujemnej sumie wag, ds i ps opisują stan po n przebiegach.
+
+    Args:
+        digraph: DiGraph - graf skierowany z wagami (lub gotowy CSRGraph)
+        s: Wierzchołek źródłowy
+
+    Returns:
+        Tuple (ds, ps, has_negative_cycle):
+            ds - tablica odległości
+            ps - tablica poprzedników
+            has_negative_cycle - czy wykryto cykl o ujemnej sumie wag osiągalny z s
+    """
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    n = csr.V
+    if s < 0 or s >= n:
+        raise ValueError(f"Wierzchołek źródłowy musi być z zakresu 0-{n-1}")
+
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[s] = 0
+
+    # Bez cyklu o ujemnej sumie wag odległości ustalają się po n-1 przebiegach,
+    # więc zmiana w przebiegu n oznacza cykl osiągalny z s
+    _, converged = relaxation_passes(csr.edge_sources(), csr.indices, csr.weights.astype(np.float64),
+                                     dist, pred, max_passes=n)
+
+    ds = dist.tolist()
+    if csr.has_integer_weights():
+        ds = [int(d) if d != float('inf') else d for d in ds]
+    ps = [p if p >= 0 else None for p in pred.tolist()]
+
+    return ds, ps, not converged
@@ -0,0 +1,84 @@
+"""
+Porównanie czasu działania algorytmu delta-stepping z algorytmem Dijkstry z kolejką priorytetową.
+
+Graf losowy jest generowany bezpośrednio w formacie CSR (budowanie obiektu DiGraph
+z milionami krawędzi trwałoby zbyt długo). Przykładowe uruchomienie:
+
+    python -m lab04.benchmark_delta_stepping --n 1000000 --m 10000000 --workers 4
+"""
+
+import argparse
+import time
+import numpy as np
+from lab04.csr_graph import CSRGraph, dijkstra_csr
+from lab04.delta_stepping import delta_stepping_csr
+
+def generate_random_csr(n, m, min_weight=1, max_weight=100, seed=None):
+    """
+    Generuje losowy digraf w formacie CSR z m krawędziami o losowych wagach całkowitych.
+
+    Args:
+        n: Liczba wierzchołków
+        m: Liczba krawędzi
+        min_weight: Minimalna waga krawędzi
+        max_weight: Maksymalna waga krawędzi
+        seed: Ziarno generatora liczb losowych
+
+    Returns:
+        CSRGraph: Wygenerowany graf
+    """
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, n, m)
+    targets = rng.integers(0, n, m)
+    weights = rng.integers(min_weight, max_weight + 1, m)
+    return CSRGraph.from_edges(n, sources, targets, weights)
+
+def benchmark(n, m, sources=3, delta=None, workers=None, seed=None, processes=False):
+    """
+    Uruchamia oba algorytmy z kilku wierzchołków źródłowych i wypisuje czasy oraz przyspieszenie.
+
+    Returns:
+        Tuple (dijkstra_time, delta_stepping_time): łączne czasy działania w sekundach
+    """
+    print(f"Generowanie grafu z {n} wierzchołkami i {m} krawędziami...")
+    csr = generate_random_csr(n, m, seed=seed)
+    csr.to_lists()  # Konwersja do list nie jest wliczana do czasu algorytmu Dijkstry
+
+    rng = np.random.default_rng(seed)
+    dijkstra_time = 0.0
+    delta_time = 0.0
+
+    for s in rng.integers(0, n, sources):
+        s = int(s)
+
+        start = time.perf_counter()
+        ds, _ = dijkstra_csr(csr, s)
+        dijkstra_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        dist, _ = delta_stepping_csr(csr, s, delta, workers, processes)
+        delta_time += time.perf_counter() - start
+
+        if not np.array_equal(np.asarray(ds, dtype=np.float64), dist):
+            raise AssertionError(f"Różne odległości dla źródła {s}")
+
+        print(f"Źródło {s}: Dijkstra {dijkstra_time:.2f} s, delta-stepping {delta_time:.2f} s (łącznie)")
+
+    print(f"\nDijkstra (kolejka priorytetowa): {dijkstra_time:.2f} s")
+    print(f"Delta-stepping: {delta_time:.2f} s")
+    print(f"Przyspieszenie: {dijkstra_time / delta_time:.2f}x")
+
+    return dijkstra_time, delta_time
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Delta-stepping a algorytm Dijkstry')
+    parser.add_argument('--n', type=int, default=1000000, help='Liczba wierzchołków')
+    parser.add_argument('--m', type=int, default=10000000, help='Liczba krawędzi')
+    parser.add_argument('--sources', type=int, default=3, help='Liczba wierzchołków źródłowych')
+    parser.add_argument('--delta', type=float, default=None, help='Szerokość kubełka')
+    parser.add_argument('--workers', type=int, default=None, help='Liczba wątków (lub procesów) roboczych')
+    parser.add_argument('--processes', action='store_true', help='Pula procesów zamiast puli wątków')
+    parser.add_argument('--seed', type=int, default=0, help='Ziarno generatora liczb losowych')
+
+    args = parser.parse_args()
+    benchmark(args.n, args.m, args.sources, args.delta, args.workers, args.seed, args.processes)
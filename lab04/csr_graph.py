@@ -0,0 +1,178 @@
+"""
+Reprezentacja grafu w formacie CSR (Compressed Sparse Row).
+
+Krawędzie wychodzące z wierzchołka u zajmują w tablicach indices i weights
+przedział [indptr[u], indptr[u+1]). Taka reprezentacja jest zbudowana raz
+i niezmienna, dzięki czemu może być współdzielona przez wiele uruchomień
+algorytmów najkrótszych ścieżek oraz przetwarzana wektorowo za pomocą NumPy.
+"""
+
+import heapq
+import numpy as np
+
+class CSRGraph:
+    """
+    Niezmienny graf ważony w formacie CSR.
+
+    Graf można zbudować z obiektu DiGraph (lub nieskierowanego Graph z lab03 -
+    jego lista sąsiedztwa zawiera każdą krawędź w obu kierunkach) albo
+    bezpośrednio z tablic krawędzi.
+    """
+
+    def __init__(self, n, indptr, indices, weights):
+        """
+        Inicjalizuje graf CSR z gotowych tablic.
+
+        Args:
+            n: Liczba wierzchołków
+            indptr: Tablica długości n+1 z początkami list krawędzi wierzchołków
+            indices: Tablica wierzchołków docelowych krawędzi
+            weights: Tablica wag krawędzi
+        """
+        self.V = n
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = np.asarray(weights)
+        if self.weights.dtype.kind not in 'if':
+            self.weights = self.weights.astype(np.float64)
+        self._lists = None
+
+    @classmethod
+    def from_digraph(cls, digraph):
+        """
+        Buduje graf CSR z obiektu grafu (DiGraph lub Graph).
+
+        Kolejność krawędzi każdego wierzchołka jest taka sama jak w liście
+        sąsiedztwa grafu, więc algorytmy przeglądające krawędzie po kolei dają
+        te same wyniki (również tych samych poprzedników) co na oryginalnym grafie.
+
+        Args:
+            digraph: Graf z atrybutem V oraz metodami get_adjacency_list i get_weight
+
+        Returns:
+            CSRGraph: Graf w formacie CSR
+        """
+        n = digraph.V
+        adjacency_list = digraph.get_adjacency_list()
+
+        indptr = [0] * (n + 1)
+        indices = []
+        weights = []
+        for u in range(n):
+            for v in adjacency_list[u]:
+                indices.append(v)
+                weights.append(digraph.get_weight(u, v))
+            indptr[u + 1] = len(indices)
+
+        if not weights:
+            weights = np.zeros(0, dtype=np.int64)
+
+        return cls(n, indptr, indices, weights)
+
+    @classmethod
+    def from_edges(cls, n, sources, targets, weights):
+        """
+        Buduje graf CSR z tablic krawędzi (u_i, v_i, w_i).
+
+        Args:
+            n: Liczba wierzchołków
+            sources: Tablica wierzchołków źródłowych krawędzi
+            targets: Tablica wierzchołków docelowych krawędzi
+            weights: Tablica wag krawędzi
+
+        Returns:
+            CSRGraph: Graf w formacie CSR
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=n)
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return cls(n, indptr, np.asarray(targets)[order], np.asarray(weights)[order])
+
+    @property
+    def E(self):
+        """Liczba krawędzi (skierowanych) w grafie."""
+        return len(self.indices)
+
+    def edge_sources(self):
+        """Zwraca tablicę wierzchołków źródłowych wszystkich krawędzi (w kolejności CSR)."""
+        return np.repeat(np.arange(self.V, dtype=np.int64), np.diff(self.indptr))
+
+    def has_integer_weights(self):
+        """Sprawdza, czy wagi krawędzi są liczbami całkowitymi."""
+        return self.weights.dtype.kind == 'i'
+
+    def reweighted(self, h):
+        """
+        Zwraca nowy graf CSR z wagami przeliczonymi potencjałami: w'(u, v) = w(u, v) + h[u] - h[v].
+
+        Args:
+            h: Tablica potencjałów wierzchołków
+
+        Returns:
+            CSRGraph: Graf o tej samej strukturze i przeliczonych wagach
+        """
+        h = np.asarray(h)
+        weights = self.weights + h[self.edge_sources()] - h[self.indices]
+        return CSRGraph(self.V, self.indptr, self.indices, weights)
+
+    def to_lists(self):
+        """
+        Zwraca tablice grafu jako listy Pythona (indptr, indices, weights).
+
+        Dostęp do elementów list jest znacznie szybszy niż do pojedynczych elementów
+        tablic NumPy, dlatego korzystają z nich algorytmy przetwarzające wierzchołki
+        po jednym (np. Dijkstra z kolejką priorytetową). Wynik jest zapamiętywany.
+        """
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._lists
+
+def dijkstra_csr(csr, s, h=None):
+    """
+    Algorytm Dijkstry z kolejką priorytetową na grafie w formacie CSR.
+
+    Daje takie same wyniki jak lab04.johnson.dijkstra dla grafu, z którego zbudowano
+    CSR (krawędzie są przeglądane w tej samej kolejności), ale nie wymaga
+    obiektu DiGraph ani wyszukiwania wag w słowniku.
+
+    Args:
+        csr: CSRGraph - graf o nieujemnych wagach (lub nieujemnych po przeliczeniu potencjałami)
+        s: Wierzchołek źródłowy
+        h: Tablica potencjałów wierzchołków (opcjonalna)
+
+    Returns:
+        Tuple (ds, ps): ds - tablica odległości, ps - tablica poprzedników
+    """
+    n = csr.V
+    indptr, indices, weights = csr.to_lists()
+
+    ds = [float('inf')] * n
+    ps = [None] * n
+    ds[s] = 0
+
+    done = [False] * n
+    queue = [(0, s)]
+
+    while queue:
+        dist_u, u = heapq.heappop(queue)
+        if done[u]:
+            continue
+        done[u] = True
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not done[v]:
+                w = weights[k]
+                if h is not None:
+                    w = w + h[u] - h[v]
+
+                if ds[v] > dist_u + w:
+                    ds[v] = dist_u + w
+                    ps[v] = u
+                    heapq.heappush(queue, (ds[v], v))
+
+    return ds, ps
@@ -0,0 +1,315 @@
+"""
+Implementacja algorytmu delta-stepping do znajdowania najkrótszych ścieżek z jednego źródła.
+
+Wierzchołki są grupowane w kubełki o szerokości delta według odległości od źródła.
+Kubełki przetwarzane są po kolei, a w ramach kubełka wszystkie wierzchołki
+relaksowane są jednocześnie:
+1. Krawędzie lekkie (w <= delta) relaksowane są wielokrotnie, dopóki kubełek się zmienia
+   (mogą dodać wierzchołki do bieżącego kubełka)
+2. Krawędzie ciężkie (w > delta) relaksowane są raz, po opróżnieniu kubełka
+   (zawsze trafiają do dalszych kubełków)
+
+Przynależność do kubełków jest przechowywana jawnie (numer kubełka każdego
+wierzchołka i listy wierzchołków poszczególnych kubełków), więc przetworzenie
+kubełka dotyczy tylko jego wierzchołków, a nie wszystkich V wierzchołków.
+Małe kubełki (np. w grafach o długich najkrótszych ścieżkach, jak sieci drogowe)
+są przetwarzane pętlą Pythona na listach grafu - narzut wywołań NumPy byłby
+dla nich większy niż sama praca.
+
+Relaksacja całego zbioru wierzchołków jest wykonywana wektorowo za pomocą NumPy
+na tablicach CSR i może zostać podzielona między wątki lub procesy robocze.
+Algorytm wymaga nieujemnych wag krawędzi.
+"""
+
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from lab04.csr_graph import CSRGraph
+
+# Minimalna liczba wierzchołków w zbiorze relaksowanym, od której opłaca się podział między wątki
+PARALLEL_THRESHOLD = 10000
+
+# Maksymalna liczba wpisów kubełka przetwarzanego pętlą Pythona zamiast wektorowo
+SMALL_BUCKET = 64
+
+# Graf i maski krawędzi procesu roboczego (ustawiane raz przy starcie procesu)
+_worker_state = None
+
+def _init_worker(csr, light, heavy):
+    """Zapamiętuje w procesie roboczym graf i maski krawędzi lekkich i ciężkich."""
+    global _worker_state
+    _worker_state = (csr, {'light': light, 'heavy': heavy})
+
+def _collect_edges_in_worker(frontier, phase, dist):
+    """Wywołuje _collect_edges w procesie roboczym dla maski krawędzi phase."""
+    csr, masks = _worker_state
+    return _collect_edges(csr, frontier, masks[phase], dist)
+
+def _collect_edges(csr, frontier, edge_mask, dist):
+    """
+    Zbiera kandydatów relaksacji dla krawędzi wychodzących z wierzchołków frontier.
+
+    Args:
+        csr: CSRGraph - graf
+        frontier: Tablica wierzchołków, których krawędzie są relaksowane
+        edge_mask: Tablica logiczna wybierająca krawędzie (lekkie lub ciężkie)
+        dist: Tablica bieżących odległości
+
+    Returns:
+        Tuple (targets, candidates, sources) - krawędzie, które poprawiają odległość
+    """
+    starts = csr.indptr[frontier]
+    counts = csr.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, np.zeros(0, dtype=dist.dtype), empty
+
+    # Indeksy wszystkich krawędzi wychodzących z wierzchołków frontier
+    edge_idx = np.arange(total, dtype=np.int64) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    sources = np.repeat(frontier, counts)
+
+    selected = edge_mask[edge_idx]
+    edge_idx = edge_idx[selected]
+    sources = sources[selected]
+
+    targets = csr.indices[edge_idx]
+    candidates = dist[sources] + csr.weights[edge_idx]
+
+    better = candidates < dist[targets]
+    return targets[better], candidates[better], sources[better]
+
+def _relax_small(lists, frontier, light_phase, delta, dist, pred):
+    """
+    Relaksuje po kolei krawędzie lekkie (light_phase) lub ciężkie wychodzące z wierzchołków frontier.
+
+    Returns:
+        Lista wierzchołków, których odległość uległa zmniejszeniu (bez powtórzeń)
+    """
+    indptr, indices, weights = lists
+    improved = {}
+    for u in frontier:
+        du = float(dist[u])
+        for k in range(indptr[u], indptr[u + 1]):
+            w = weights[k]
+            if (w <= delta) != light_phase:
+                continue
+            v = indices[k]
+            candidate = du + w
+            if candidate < dist[v]:
+                dist[v] = candidate
+                pred[v] = u
+                improved[v] = True
+    return list(improved)
+
+def _relax(csr, frontier, phase, masks, dist, pred, executor=None, workers=1):
+    """
+    Relaksuje wektorowo krawędzie fazy phase ('light' lub 'heavy') wychodzące z wierzchołków frontier.
+
+    Dla każdego wierzchołka docelowego wybierana jest najlepsza z propozycji,
+    a następnie tablice dist i pred są aktualizowane. Procesy robocze mają
+    własną kopię grafu i masek, więc do procesu przekazywane są tylko
+    wierzchołki frontier i tablica odległości.
+
+    Returns:
+        Tablica wierzchołków, których odległość uległa zmniejszeniu
+    """
+    edge_mask = masks[phase]
+    if executor is not None and len(frontier) >= PARALLEL_THRESHOLD:
+        chunks = np.array_split(frontier, workers)
+        if isinstance(executor, ProcessPoolExecutor):
+            parts = list(executor.map(_collect_edges_in_worker, chunks,
+                                      [phase] * len(chunks), [dist] * len(chunks)))
+        else:
+            parts = list(executor.map(lambda chunk: _collect_edges(csr, chunk, edge_mask, dist), chunks))
+        targets = np.concatenate([part[0] for part in parts])
+        candidates = np.concatenate([part[1] for part in parts])
+        sources = np.concatenate([part[2] for part in parts])
+    else:
+        targets, candidates, sources = _collect_edges(csr, frontier, edge_mask, dist)
+
+    if len(targets) == 0:
+        return targets
+
+    # Najmniejsza propozycja dla każdego wierzchołka docelowego
+    order = np.lexsort((candidates, targets))
+    sorted_targets = targets[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_targets[1:] != sorted_targets[:-1]
+    best = order[first]
+
+    improved = targets[best]
+    dist[improved] = candidates[best]
+    pred[improved] = sources[best]
+    return improved
+
+def delta_stepping_csr(csr, s, delta=None, workers=None, processes=False):
+    """
+    Algorytm delta-stepping na grafie w formacie CSR.
+
+    Args:
+        csr: CSRGraph - graf o nieujemnych wagach
+        s: Wierzchołek źródłowy
+        delta: Szerokość kubełka (jeśli None, średnia waga krawędzi)
+        workers: Liczba wątków (lub procesów) dzielących relaksację dużych kubełków
+                 (None - bez podziału)
+        processes: Czy użyć puli procesów zamiast puli wątków
+
+    Returns:
+        Tuple (dist, pred): dist - tablica NumPy odległości (np.inf dla nieosiągalnych),
+            pred - tablica NumPy poprzedników (-1 dla źródła i wierzchołków nieosiągalnych)
+    """
+    n = csr.V
+    if s < 0 or s >= n:
+        raise ValueError(f"Wierzchołek źródłowy musi być z zakresu 0-{n-1}")
+
+    weights = csr.weights
+    if len(weights) and weights.min() < 0:
+        raise ValueError("Algorytm delta-stepping wymaga nieujemnych wag krawędzi")
+
+    if delta is None:
+        delta = float(weights.mean()) if len(weights) else 1.0
+    if delta <= 0:
+        delta = 1.0
+
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=bool)
+    dist[s] = 0
+
+    light = weights <= delta
+    masks = {'light': light, 'heavy': ~light}
+
+    # Kubełek każdego wierzchołka (-1 - brak) i listy wierzchołków kubełków.
+    # Listy mogą zawierać wpisy nieaktualne (wierzchołek przeniesiony do innego
+    # kubełka) - są one pomijane przy opróżnianiu kubełka.
+    vertex_bucket = np.full(n, -1, dtype=np.int64)
+    buckets = {}
+    bucket_heap = []
+
+    def enqueue(vertices):
+        numbers = np.floor(dist[vertices] / delta).astype(np.int64)
+        vertex_bucket[vertices] = numbers
+        order = np.argsort(numbers, kind='stable')
+        numbers, starts = np.unique(numbers[order], return_index=True)
+        for number, part in zip(numbers.tolist(), np.split(vertices[order], starts[1:])):
+            if number not in buckets:
+                buckets[number] = []
+                heapq.heappush(bucket_heap, number)
+            buckets[number].append(part)
+
+    def enqueue_small(vertices):
+        for v in vertices:
+            number = math.floor(dist[v] / delta)
+            vertex_bucket[v] = number
+            if number not in buckets:
+                buckets[number] = []
+                heapq.heappush(bucket_heap, number)
+            buckets[number].append([v])
+
+    enqueue_small([s])
+
+    executor = None
+    if workers is not None and workers > 1:
+        if processes:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(csr, masks['light'], masks['heavy']))
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+    try:
+        while bucket_heap:
+            # Najmniejszy niepusty kubełek
+            number = heapq.heappop(bucket_heap)
+            parts = buckets.pop(number)
+
+            if sum(len(part) for part in parts) <= SMALL_BUCKET:
+                lists = csr.to_lists()
+                frontier = [v for part in parts for v in part
+                            if vertex_bucket[v] == number and not settled[v]]
+                members = set(frontier)
+
+                # Faza krawędzi lekkich - powtarzana, dopóki bieżący kubełek się zmienia
+                while frontier:
+                    improved = _relax_small(lists, frontier, True, delta, dist, pred)
+                    frontier = [v for v in improved if math.floor(dist[v] / delta) == number]
+                    for v in frontier:
+                        vertex_bucket[v] = number
+                    members.update(frontier)
+                    if len(frontier) < len(improved):
+                        enqueue_small([v for v in improved if math.floor(dist[v] / delta) != number])
+
+                for v in members:
+                    settled[v] = True
+                    vertex_bucket[v] = -1
+
+                # Faza krawędzi ciężkich - jednokrotnie dla wszystkich wierzchołków kubełka
+                enqueue_small(_relax_small(lists, members, False, delta, dist, pred))
+                continue
+
+            frontier = np.concatenate([np.asarray(part, dtype=np.int64) for part in parts])
+            frontier = np.unique(frontier[(vertex_bucket[frontier] == number) & ~settled[frontier]])
+            if len(frontier) == 0:
+                continue
+            members = [frontier]
+
+            # Faza krawędzi lekkich - powtarzana, dopóki bieżący kubełek się zmienia
+            while len(frontier):
+                improved = _relax(csr, frontier, 'light', masks, dist, pred, executor, workers)
+                if len(improved) == 0:
+                    break
+                current = np.floor(dist[improved] / delta).astype(np.int64) == number
+                frontier = improved[current]
+                vertex_bucket[frontier] = number
+                if len(frontier):
+                    members.append(frontier)
+                if not current.all():
+                    enqueue(improved[~current])
+
+            bucket_vertices = np.unique(np.concatenate(members))
+            settled[bucket_vertices] = True
+            vertex_bucket[bucket_vertices] = -1
+
+            # Faza krawędzi ciężkich - jednokrotnie dla wszystkich wierzchołków kubełka
+            improved = _relax(csr, bucket_vertices, 'heavy', masks, dist, pred, executor, workers)
+            if len(improved):
+                enqueue(improved)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return dist, pred
+
+def delta_stepping(digraph, s, h=None, delta=None, workers=None, processes=False):
+    """
+    Algorytm delta-stepping jako zamiennik dla lab04.johnson.dijkstra i lab03.zad2.dijkstra.
+
+    Przyjmuje graf (DiGraph lub nieskierowany Graph z lab03) i zwraca wynik w tym
+    samym formacie (ds, ps) co algorytm Dijkstry. Odległości są identyczne; przy
+    kilku najkrótszych ścieżkach tej samej długości wybrany poprzednik może się
+    różnić, ale zawsze wyznacza najkrótszą ścieżkę.
+
+    Args:
+        digraph: Graf o nieujemnych wagach (lub nieujemnych po przeliczeniu potencjałami h)
+        s: Wierzchołek źródłowy
+        h: Tablica potencjałów wierzchołków (opcjonalna, jak w lab04.johnson.dijkstra)
+        delta: Szerokość kubełka (jeśli None, średnia waga krawędzi)
+        workers: Liczba wątków (lub procesów) roboczych (None - bez podziału)
+        processes: Czy użyć puli procesów zamiast puli wątków
+
+    Returns:
+        Tuple (ds, ps): ds - tablica odległości, ps - tablica poprzedników
+    """
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    if h is not None:
+        csr = csr.reweighted(h)
+
+    dist, pred = delta_stepping_csr(csr, s, delta, workers, processes)
+
+    ds = dist.tolist()
+    if csr.has_integer_weights():
+        ds = [int(d) if d != float('inf') else d for d in ds]
+    ps = [p if p >= 0 else None for p in pred.tolist()]
+
+    return ds, ps
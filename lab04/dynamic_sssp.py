@@ -0,0 +1,274 @@
+"""
+Dynamiczne utrzymywanie drzewa najkrótszych ścieżek z jednego źródła.
+
+Implementacja w stylu algorytmu Ramalingama-Repsa: po wstawieniu, usunięciu lub
+zmianie wagi krawędzi naprawiana jest tylko ta część drzewa najkrótszych ścieżek,
+na którą zmiana faktycznie wpływa, zamiast ponownego uruchamiania algorytmu
+Bellmana-Forda lub Dijkstry dla całego grafu.
+"""
+
+import heapq
+from lab04.bellman_ford import bellman_ford
+
+class DynamicShortestPaths:
+    """
+    Tablice ds i ps (jak w wyniku bellman_ford / dijkstra) utrzymywane przy zmianach krawędzi.
+
+    Obiekt przechowuje własną kopię krawędzi grafu (listy krawędzi wychodzących
+    i wchodzących z wagami), więc zmiany nie są wprowadzane do oryginalnego obiektu
+    DiGraph - jego przebudowa (macierz incydencji) przy każdej aktualizacji byłaby
+    zbyt kosztowna.
+
+    Dopuszczalne są ujemne wagi krawędzi, o ile w części grafu osiągalnej ze źródła
+    nie powstaje cykl o ujemnej sumie wag - taka aktualizacja jest odrzucana
+    wyjątkiem ValueError, a stan obiektu pozostaje bez zmian.
+    """
+
+    def __init__(self, digraph, s, ds=None, ps=None):
+        """
+        Inicjalizuje strukturę dla digrafu i wierzchołka źródłowego s.
+
+        Args:
+            digraph: DiGraph - graf skierowany z wagami
+            s: Wierzchołek źródłowy
+            ds: Tablica odległości od s (jeśli None, zostanie obliczona algorytmem Bellmana-Forda)
+            ps: Tablica poprzedników (wymagana, jeśli podano ds)
+        """
+        n = digraph.V
+        self.V = n
+        self.s = s
+
+        # Krawędzie wychodzące i wchodzące: wierzchołek -> {sąsiad: waga}
+        self.out_edges = [{} for _ in range(n)]
+        self.in_edges = [{} for _ in range(n)]
+        for (u, v), w in digraph.get_weights().items():
+            self.out_edges[u][v] = w
+            self.in_edges[v][u] = w
+
+        if ds is None:
+            ds, ps, has_negative_cycle = bellman_ford(digraph, s)
+            if has_negative_cycle:
+                raise ValueError("Graf zawiera cykl o ujemnej sumie wag osiągalny ze źródła")
+
+        self.ds = list(ds)
+        self.ps = list(ps)
+
+        # Dzieci każdego wierzchołka w drzewie najkrótszych ścieżek
+        self.children = [set() for _ in range(n)]
+        for v in range(n):
+            if self.ps[v] is not None:
+                self.children[self.ps[v]].add(v)
+
+    def get_weight(self, u, v):
+        """Zwraca wagę krawędzi od u do v, lub None jeśli krawędź nie istnieje."""
+        return self.out_edges[u].get(v)
+
+    def insert_edge(self, u, v, w):
+        """
+        Wstawia krawędź (u, v) o wadze w (lub zmienia wagę istniejącej krawędzi).
+
+        Args:
+            u: Wierzchołek źródłowy krawędzi
+            v: Wierzchołek docelowy krawędzi
+            w: Waga krawędzi
+
+        Returns:
+            Liczba wierzchołków, których odległość od źródła uległa zmianie
+        """
+        if u < 0 or v < 0 or u >= self.V or v >= self.V:
+            raise ValueError(f"Indeksy wierzchołków muszą być z zakresu 0-{self.V-1}")
+
+        old_weight = self.out_edges[u].get(v)
+        if old_weight is not None and w > old_weight:
+            return self._increase(u, v, w)
+        return self._decrease(u, v, w, old_weight)
+
+    def update_weight(self, u, v, w):
+        """
+        Zmienia wagę istniejącej krawędzi (u, v) na w.
+
+        Returns:
+            Liczba wierzchołków, których odległość od źródła uległa zmianie
+        """
+        if self.out_edges[u].get(v) is None:
+            raise ValueError(f"Krawędź ({u}, {v}) nie istnieje")
+        return self.insert_edge(u, v, w)
+
+    def delete_edge(self, u, v):
+        """
+        Usuwa krawędź (u, v).
+
+        Returns:
+            Liczba wierzchołków, których odległość od źródła uległa zmianie
+        """
+        if self.out_edges[u].get(v) is None:
+            raise ValueError(f"Krawędź ({u}, {v}) nie istnieje")
+        return self._increase(u, v, None)
+
+    def _set_edge(self, u, v, w):
+        """Ustawia wagę krawędzi (u, v) lub usuwa ją, gdy w jest None."""
+        if w is None:
+            del self.out_edges[u][v]
+            del self.in_edges[v][u]
+        else:
+            self.out_edges[u][v] = w
+            self.in_edges[v][u] = w
+
+    def _set_parent(self, x, p):
+        """Zmienia poprzednika wierzchołka x w drzewie najkrótszych ścieżek."""
+        if self.ps[x] is not None:
+            self.children[self.ps[x]].discard(x)
+        self.ps[x] = p
+        if p is not None:
+            self.children[p].add(x)
+
+    def _decrease(self, u, v, w, old_weight):
+        """
+        Obsługuje wstawienie krawędzi lub zmniejszenie jej wagi.
+
+        Zmiany propagowane są od v w kolejności rosnącej zmiany odległości
+        (nowa odległość - stara odległość), co odpowiada algorytmowi Dijkstry
+        na wagach zredukowanych potencjałami ds. Wierzchołki wcześniej
+        nieosiągalne nie mają potencjału - są przetwarzane po nich, w kolejności
+        rosnącej nowej odległości (zwykły algorytm Dijkstry dla nowo osiągniętej
+        części grafu). Wierzchołki mogą być przetwarzane ponownie, więc ujemne
+        wagi są obsługiwane poprawnie.
+
+        Cykl o ujemnej sumie wag jest wykrywany na dwa sposoby:
+        - poprawa odległości do u oznacza nowy cykl zawierający krawędź (u, v),
+        - wierzchołek poprawiony więcej niż V razy (np. gdy nowa krawędź czyni
+          osiągalnym istniejący wcześniej cykl o ujemnej sumie wag) - cykl jest
+          potwierdzany w łańcuchu poprzedników; bez cyklu o ujemnej sumie wag
+          łańcuch poprzedników jest acykliczny, a odległości nie mogą maleć
+          bez końca, więc naprawa zawsze się kończy.
+        """
+        ds, ps = self.ds, self.ps
+        self._set_edge(u, v, w)
+
+        if ds[u] + w >= ds[v]:
+            return 0
+
+        # Dziennik zmian do wycofania w razie wykrycia cyklu o ujemnej sumie wag
+        log = {}
+        updates = {}
+        queue = []
+
+        def on_predecessor_cycle(x):
+            # Czy łańcuch poprzedników z x zawiera cykl
+            seen = set()
+            while x is not None and x not in seen:
+                seen.add(x)
+                x = ps[x]
+            return x is not None
+
+        def improve(x, new_distance, parent):
+            if x not in log:
+                log[x] = (ds[x], ps[x])
+            old_distance = log[x][0]
+            ds[x] = new_distance
+            self._set_parent(x, parent)
+            updates[x] = updates.get(x, 0) + 1
+
+            # Najpierw wierzchołki wcześniej osiągalne (według zmiany odległości),
+            # potem wcześniej nieosiągalne (według nowej odległości)
+            if old_distance != float('inf'):
+                key = (0, new_distance - old_distance)
+            else:
+                key = (1, new_distance)
+            heapq.heappush(queue, (key, x, new_distance))
+
+            # Poprawa odległości do u lub cykl poprzedników oznacza cykl o ujemnej sumie wag
+            if x == u:
+                return False
+            return updates[x] <= self.V or not on_predecessor_cycle(x)
+
+        ok = improve(v, ds[u] + w, u)
+        while ok and queue:
+            _, x, distance_x = heapq.heappop(queue)
+
+            # Pomiń nieaktualne wpisy w kolejce
+            if distance_x != ds[x]:
+                continue
+
+            for y, w_xy in self.out_edges[x].items():
+                if ds[x] + w_xy < ds[y]:
+                    if not improve(y, ds[x] + w_xy, x):
+                        ok = False
+                        break
+
+        if not ok:
+            # Wycofaj wszystkie zmiany odległości, poprzedników i samej krawędzi
+            for x, (old_distance, old_parent) in log.items():
+                ds[x] = old_distance
+                self._set_parent(x, old_parent)
+            self._set_edge(u, v, old_weight)
+            raise ValueError(f"Krawędź ({u}, {v}) o wadze {w} tworzy cykl o ujemnej sumie wag")
+
+        return len(log)
+
+    def _increase(self, u, v, w):
+        """
+        Obsługuje usunięcie krawędzi (w=None) lub zwiększenie jej wagi.
+
+        Jeśli krawędź nie należy do drzewa najkrótszych ścieżek, żadna odległość
+        się nie zmienia. W przeciwnym razie naprawiane jest tylko poddrzewo v:
+        każdy jego wierzchołek otrzymuje najlepszą odległość przez krawędź
+        z wierzchołka spoza poddrzewa, a następnie odległości są poprawiane
+        algorytmem Dijkstry ograniczonym do poddrzewa (na wagach zredukowanych
+        starymi odległościami, które są nieujemne także przy ujemnych wagach).
+        """
+        ds, ps = self.ds, self.ps
+        self._set_edge(u, v, w)
+
+        if ps[v] != u:
+            return 0
+
+        # Wyznacz poddrzewo v (wierzchołki, których ścieżka prowadziła przez krawędź (u, v))
+        affected = [v]
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            for child in self.children[x]:
+                affected.append(child)
+                stack.append(child)
+
+        affected_set = set(affected)
+        old_distances = {x: ds[x] for x in affected}
+
+        # Odłącz poddrzewo od drzewa
+        self.children[u].discard(v)
+        for x in affected:
+            self.children[x] = set()
+            ds[x] = float('inf')
+            ps[x] = None
+
+        # Najlepsza odległość każdego wierzchołka poddrzewa przez krawędź spoza poddrzewa
+        queue = []
+        for x in affected:
+            for y, w_yx in self.in_edges[x].items():
+                if y not in affected_set and ds[y] + w_yx < ds[x]:
+                    ds[x] = ds[y] + w_yx
+                    ps[x] = y
+            if ds[x] != float('inf'):
+                heapq.heappush(queue, (ds[x] - old_distances[x], x, ds[x]))
+
+        # Algorytm Dijkstry ograniczony do poddrzewa
+        done = set()
+        while queue:
+            _, x, distance_x = heapq.heappop(queue)
+            if x in done or distance_x != ds[x]:
+                continue
+            done.add(x)
+
+            for y, w_xy in self.out_edges[x].items():
+                if y in affected_set and y not in done and ds[x] + w_xy < ds[y]:
+                    ds[y] = ds[x] + w_xy
+                    ps[y] = x
+                    heapq.heappush(queue, (ds[y] - old_distances[y], y, ds[y]))
+
+        # Odbuduj listy dzieci dla wierzchołków poddrzewa
+        for x in affected:
+            if ps[x] is not None:
+                self.children[ps[x]].add(x)
+
+        return sum(1 for x in affected if ds[x] != old_distances[x])
@@ -3,9 +3,14 @@ Implementacja algorytmu Johnsona do znajdowania najkrótszych ścieżek między
 Algorytm może obsługiwać krawędzie o ujemnych wagach, o ile w grafie nie ma cyklu o ujemnej sumie wag.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from lab04.digraph_representation import DiGraph
-from lab04.bellman_ford import bellman_ford, init, relax
+from lab04.bellman_ford import init
+from lab04.csr_graph import CSRGraph, dijkstra_csr
+from lab04.predecessor_matrix import NO_PREDECESSOR, new_predecessor_matrix, predecessor
+from lab03.row_block_store import DEFAULT_BLOCK_ROWS, RowBlockStore, data_fingerprint
 import heapq
+import numpy as np
 
 def add_s(digraph):
     """
@@ -83,49 +88,172 @@ def dijkstra(digraph, s, h=None):
     
     return ds, ps
 
-def johnson(digraph):
+def compute_potentials(csr):
+    """
+    Wyznacza potencjały wierzchołków h algorytmem Bellmana-Forda z wirtualnego źródła s.
+    
+    Wynik jest taki sam jak odległości od nowego wierzchołka s połączonego krawędziami
+    o wadze 0 ze wszystkimi wierzchołkami (add_s + bellman_ford), ale graf poszerzony
+    nie jest budowany - wystarczy zainicjalizować wszystkie odległości zerem.
+    Przebiegi kończą się wcześniej, gdy żadna odległość się nie zmienia.
+    
+    Args:
+        csr: CSRGraph - graf skierowany z wagami
+        
+    Returns:
+        Lista potencjałów h lub None, jeśli graf zawiera cykl o ujemnej sumie wag
+    """
+    n = csr.V
+    _, targets, weights = csr.to_lists()
+    edges = list(zip(csr.edge_sources().tolist(), targets, weights))
+    h = [0] * n
+    
+    # Graf poszerzony ma n+1 wierzchołków, więc wystarcza n przebiegów;
+    # zmiana w przebiegu n+1 oznacza cykl o ujemnej sumie wag
+    for _ in range(n + 1):
+        changed = False
+        for u, v, w in edges:
+            if h[u] + w < h[v]:
+                h[v] = h[u] + w
+                changed = True
+        if not changed:
+            return h
+    
+    return None
+
+# Graf z przeliczonymi wagami współdzielony przez procesy robocze
+_worker_csr = None
+
+def _init_worker(csr):
+    """Zapamiętuje graf z przeliczonymi wagami w procesie roboczym."""
+    global _worker_csr
+    _worker_csr = csr
+
+def _dijkstra_rows(sources):
+    """Uruchamia algorytm Dijkstry z każdego źródła w procesie roboczym."""
+    return [(u,) + dijkstra_csr(_worker_csr, u) for u in sources]
+
+def dijkstra_rows(csr, workers=None, start=0):
+    """
+    Uruchamia algorytm Dijkstry (dijkstra_csr) z każdego wierzchołka grafu CSR.
+    
+    Args:
+        csr: CSRGraph - graf o nieujemnych wagach
+        workers: Liczba procesów roboczych (None - obliczenia w bieżącym procesie);
+                 każdy proces otrzymuje tablice grafu tylko raz, przy uruchomieniu
+        start: Pierwszy wierzchołek źródłowy (wcześniejsze są pomijane)
+        
+    Returns:
+        Iterator krotek (u, ds, ps) w kolejności rosnących u
+    """
+    n = csr.V
+    if workers is None or workers <= 1 or n - start < 2:
+        return ((u,) + dijkstra_csr(csr, u) for u in range(start, n))
+    
+    chunk_size = max(1, (n - start) // (workers * 4))
+    chunks = [range(first, min(n, first + chunk_size)) for first in range(start, n, chunk_size)]
+    
+    def parallel_rows():
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(csr,)) as executor:
+            for part in executor.map(_dijkstra_rows, chunks):
+                yield from part
+    
+    return parallel_rows()
+
+def _johnson_rows(digraph, workers=None, start=0):
+    """
+    Wspólna część algorytmu Johnsona: potencjały, przeliczenie wag i Dijkstra z każdego źródła.
+    
+    Graf z przeliczonymi wagami jest budowany raz jako niezmienne tablice CSR
+    i współdzielony przez wszystkie uruchomienia algorytmu Dijkstry.
+    
+    Args:
+        digraph: DiGraph - graf skierowany z wagami (lub gotowy CSRGraph)
+        workers: Liczba procesów roboczych (None - obliczenia w bieżącym procesie)
+        start: Pierwszy wierzchołek źródłowy (przy wznawianiu obliczeń)
+        
+    Returns:
+        Tuple (h, rows): h - potencjały wierzchołków, rows - iterator krotek
+            (u, d_hat_u, p_hat_u) dla każdego źródła u >= start; (None, None) jeśli graf
+            zawiera cykl o ujemnej sumie wag
+    """
+    # Kroki 1-3: Potencjały wierzchołków (Bellman-Ford z wirtualnego źródła s)
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    h = compute_potentials(csr)
+    if h is None:
+        return None, None
+    
+    # Krok 4: Przelicz wagi krawędzi (raz, dla wszystkich źródeł)
+    csr_hat = csr.reweighted(h)
+    
+    # Krok 5: Dla każdego wierzchołka uruchom Dijkstrę
+    return h, dijkstra_rows(csr_hat, workers, start)
+
+def _johnson_to_disk(digraph, out_path, predecessors_path=None, workers=None,
+                     block_rows=DEFAULT_BLOCK_ROWS):
+    """
+    Algorytm Johnsona zapisujący wiersze macierzy odległości (i poprzedników) na dysk.
+    
+    Każdy wiersz jest przeliczany na rzeczywiste odległości i od razu zapisywany
+    do pliku mapowanego do pamięci (RowBlockStore), więc macierz V×V nigdy nie
+    jest przechowywana w pamięci RAM. Jeśli w out_path znajduje się przerwany
+    wynik dla tego samego grafu, obliczenia są wznawiane od pierwszego
+    nieukończonego bloku wierszy.
+    
+    Returns:
+        Tuple (D, P): macierze mapowane z plików w trybie tylko do odczytu
+            (P jest None bez predecessors_path) lub (None, None), jeśli graf
+            zawiera cykl o ujemnej sumie wag
+    """
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    store = RowBlockStore(out_path, csr.V, block_rows, predecessors_path,
+                          fingerprint=data_fingerprint(csr.indptr, csr.indices, csr.weights))
+    
+    if not store.complete:
+        h, rows = _johnson_rows(csr, workers, store.next_row)
+        if h is None:
+            return None, None
+        
+        h = np.asarray(h, dtype=np.float64)
+        for u, d_hat_u, p_hat_u in rows:
+            # inf - h[u] + h[v] pozostaje inf dla wierzchołków nieosiągalnych
+            store.write_row(u, np.asarray(d_hat_u, dtype=np.float64) - h[u] + h, p_hat_u)
+    
+    return store.open_result()
+
+def johnson(digraph, workers=None, out_path=None, block_rows=DEFAULT_BLOCK_ROWS):
     """
     Algorytm Johnsona do znajdowania najkrótszych ścieżek między wszystkimi parami wierzchołków.
     
+    Jeśli podano out_path, wiersze macierzy odległości są zapisywane na bieżąco
+    do pliku .npy (float64, np.inf dla par nieosiągalnych), a wynikiem jest macierz
+    mapowana z tego pliku. Przerwane obliczenia są wznawiane przy ponownym wywołaniu.
+    
     Args:
         digraph: DiGraph - graf skierowany z wagami
+        workers: Liczba procesów roboczych dla uruchomień algorytmu Dijkstry
+                 (None - obliczenia w bieżącym procesie)
+        out_path: Ścieżka pliku .npy dla macierzy odległości (opcjonalna)
+        block_rows: Liczba wierszy zapisywanych między aktualizacjami pliku postępu
         
     Returns:
         Macierz odległości lub None, jeśli graf zawiera cykl o ujemnej sumie wag
     """
-    # Krok 1: Dodaj nowy wierzchołek s
-    G_prime = add_s(digraph)
+    if out_path is not None:
+        D, _ = _johnson_to_disk(digraph, out_path, None, workers, block_rows)
+        return D
     
-    # Krok 2: Uruchom Bellmana-Forda od s
-    ds, ps, has_negative_cycle = bellman_ford(G_prime, G_prime.V - 1)
+    h, rows = _johnson_rows(digraph, workers)
     
     # Jeśli wykryto cykl o ujemnej sumie wag, zakończ
-    if has_negative_cycle:
+    if h is None:
         return None
     
-    # Krok 3: Oblicz potencjały wierzchołków
     n = digraph.V
-    h = ds[:n]  # Potencjały to odległości od s do wszystkich wierzchołków
-    
-    # Krok 4: Przelicz wagi krawędzi
-    # Tworzymy nową macierz wag
-    wb = {}
-    for u, v in digraph.get_edges():
-        w = digraph.get_weight(u, v)
-        wb[(u, v)] = w + h[u] - h[v]
-    
-    # Krok 5: Dla każdego wierzchołka uruchom Dijkstrę
     D = [[float('inf') for _ in range(n)] for _ in range(n)]
     
-    for u in range(n):
-        # Stwórz kopię grafu z przeskalowanymi wagami
-        G_hat = DiGraph(n)
-        for edge_u, edge_v in digraph.get_edges():
-            G_hat.add_edge(edge_u, edge_v, wb[(edge_u, edge_v)])
-        
-        # Uruchom Dijkstrę od u
-        d_hat_u, _ = dijkstra(G_hat, u)
-        
+    for u, d_hat_u, _ in rows:
         # Przelicz rzeczywiste odległości
         for v in range(n):
             if d_hat_u[v] != float('inf'):
@@ -133,52 +261,63 @@ def johnson(digraph):
     
     return D
 
-def johnson_with_paths(digraph):
+def johnson_with_paths(digraph, workers=None, compact=False, mmap_path=None, out_path=None,
+                       block_rows=DEFAULT_BLOCK_ROWS):
     """
     Algorytm Johnsona do znajdowania najkrótszych ścieżek między wszystkimi parami wierzchołków
     wraz z informacją o ścieżkach.
     
+    W trybie zwartym (compact=True) macierz poprzedników jest tablicą NumPy typu
+    int32 z wartością -1 zamiast None (4 bajty na element zamiast obiektów Pythona).
+    Jeśli podano mmap_path, tablica jest zapisywana w pliku .npy mapowanym do pamięci,
+    który można otworzyć w innych procesach (np.load(mmap_path, mmap_mode='r')).
+    
+    Jeśli podano out_path (wymaga mmap_path), również macierz odległości jest
+    zapisywana na dysk wiersz po wierszu i obliczenia można wznowić po przerwaniu
+    (tak jak w johnson z out_path).
+    
     Args:
         digraph: DiGraph - graf skierowany z wagami
+        workers: Liczba procesów roboczych dla uruchomień algorytmu Dijkstry
+                 (None - obliczenia w bieżącym procesie)
+        compact: Czy zwrócić macierz poprzedników jako tablicę int32
+        mmap_path: Ścieżka pliku .npy dla macierzy poprzedników (implikuje compact=True)
+        out_path: Ścieżka pliku .npy dla macierzy odległości (opcjonalna)
+        block_rows: Liczba wierszy zapisywanych między aktualizacjami pliku postępu
         
     Returns:
         Tuple (D, P): D - macierz odległości, P - macierz poprzedników
             lub (None, None), jeśli graf zawiera cykl o ujemnej sumie wag
     """
-    # Krok 1: Dodaj nowy wierzchołek s
-    G_prime = add_s(digraph)
+    if out_path is not None:
+        if mmap_path is None:
+            raise ValueError("Zapis macierzy odległości na dysk wymaga podania mmap_path")
+        return _johnson_to_disk(digraph, out_path, mmap_path, workers, block_rows)
     
-    # Krok 2: Uruchom Bellmana-Forda od s
-    ds, ps, has_negative_cycle = bellman_ford(G_prime, G_prime.V - 1)
+    h, rows = _johnson_rows(digraph, workers)
     
     # Jeśli wykryto cykl o ujemnej sumie wag, zakończ
-    if has_negative_cycle:
+    if h is None:
         return None, None
     
-    # Krok 3: Oblicz potencjały wierzchołków
     n = digraph.V
-    h = ds[:n]  # Potencjały to odległości od s do wszystkich wierzchołków
+    D = [[float('inf') for _ in range(n)] for _ in range(n)]
     
-    # Krok 4: Przelicz wagi krawędzi
-    # Tworzymy nową macierz wag
-    wb = {}
-    for u, v in digraph.get_edges():
-        w = digraph.get_weight(u, v)
-        wb[(u, v)] = w + h[u] - h[v]
+    if compact or mmap_path is not None:
+        P = new_predecessor_matrix(n, mmap_path)
+        for u, d_hat_u, p_hat_u in rows:
+            for v in range(n):
+                if d_hat_u[v] != float('inf'):
+                    D[u][v] = d_hat_u[v] - h[u] + h[v]
+            P[u] = [p if p is not None else NO_PREDECESSOR for p in p_hat_u]
+        
+        if mmap_path is not None:
+            P.flush()
+        return D, P
     
-    # Krok 5: Dla każdego wierzchołka uruchom Dijkstrę
-    D = [[float('inf') for _ in range(n)] for _ in range(n)]
     P = [[None for _ in range(n)] for _ in range(n)]
     
-    for u in range(n):
-        # Stwórz kopię grafu z przeskalowanymi wagami
-        G_hat = DiGraph(n)
-        for edge_u, edge_v in digraph.get_edges():
-            G_hat.add_edge(edge_u, edge_v, wb[(edge_u, edge_v)])
-        
-        # Uruchom Dijkstrę od u
-        d_hat_u, p_hat_u = dijkstra(G_hat, u)
-        
+    for u, d_hat_u, p_hat_u in rows:
         # Przelicz rzeczywiste odległości i zapisz poprzedników
         for v in range(n):
             if d_hat_u[v] != float('inf'):
@@ -192,7 +331,7 @@ def get_path_from_predecessors(P, u, v):
     Odtwarza ścieżkę od u do v na podstawie macierzy poprzedników.
     
     Args:
-        P: Macierz poprzedników
+        P: Macierz poprzedników (lista list z None lub tablica int32 z -1)
         u: Wierzchołek źródłowy
         v: Wierzchołek docelowy
         
@@ -202,7 +341,7 @@ def get_path_from_predecessors(P, u, v):
     if u == v:
         return [u]
     
-    if P[u][v] is None:
+    if predecessor(P, u, v) is None:
         return None
     
     path = []
@@ -210,7 +349,7 @@ def get_path_from_predecessors(P, u, v):
     
     while current != u:
         path.append(current)
-        current = P[u][current]
+        current = predecessor(P, u, current)
         
         # Jeśli nie ma poprzednika, ścieżka nie istnieje
         if current is None:
@@ -219,4 +358,73 @@ def get_path_from_predecessors(P, u, v):
     path.append(u)
     path.reverse()
     
-    return path 
\ No newline at end of file
+    return path
+
+def update_distance_matrix(D, u, v, weight, P=None):
+    """
+    Aktualizuje macierz odległości (i opcjonalnie poprzedników) z algorytmu Johnsona
+    po dodaniu krawędzi skierowanej (u, v) lub zmniejszeniu jej wagi.
+    
+    Nowa najkrótsza ścieżka może skorzystać z krawędzi (u, v) co najwyżej raz, więc:
+        D'[i][j] = min(D[i][j], D[i][u] + w + D[v][j])
+    Aktualizowane są tylko wiersze i, dla których D[i][u] + w < D[i][v], oraz kolumny j,
+    dla których w + D[v][j] < D[u][j] - tylko takie pary mogą ulec skróceniu.
+    
+    Jeśli nowa krawędź tworzy cykl o ujemnej sumie wag (w + D[v][u] < 0), macierze
+    pozostają bez zmian, a funkcja zwraca None (tak jak johnson dla takiego grafu).
+    
+    Funkcja modyfikuje macierze w miejscu. Sam digraf nie jest zmieniany.
+    Zwiększenie wagi krawędzi nie jest obsługiwane.
+    
+    Złożoność: O(V²) w najgorszym przypadku, zwykle O(V + liczba zmienionych par).
+    
+    Args:
+        D: Macierz odległości (wynik johnson lub johnson_with_paths)
+        u: Wierzchołek źródłowy krawędzi
+        v: Wierzchołek docelowy krawędzi
+        weight: Nowa waga krawędzi (u, v)
+        P: Macierz poprzedników z johnson_with_paths (opcjonalna)
+        
+    Returns:
+        Liczba elementów macierzy odległości, które uległy zmianie,
+        lub None, jeśli krawędź tworzy cykl o ujemnej sumie wag
+    """
+    n = len(D)
+    if u < 0 or v < 0 or u >= n or v >= n:
+        raise ValueError(f"Indeksy wierzchołków muszą być z zakresu 0-{n-1}")
+    
+    # Krawędź tworzy cykl o ujemnej sumie wag
+    if weight + D[v][u] < 0:
+        return None
+    
+    # Krawędź nie skraca nawet odległości od u do v - nic się nie zmienia
+    if D[u][v] <= weight:
+        return 0
+    
+    # Kopie wierszy u i v sprzed aktualizacji
+    row_u = list(D[u])
+    row_v = list(D[v])
+    pred_v = list(P[v]) if P is not None else None
+    
+    # Wierzchołki docelowe, do których można dotrzeć szybciej przez krawędź u -> v
+    targets = [j for j in range(n) if weight + row_v[j] < row_u[j]]
+    
+    changed = 0
+    for i in range(n):
+        through = D[i][u] + weight
+        if through >= D[i][v]:
+            continue
+        
+        row = D[i]
+        for j in targets:
+            candidate = through + row_v[j]
+            if candidate < row[j]:
+                row[j] = candidate
+                changed += 1
+                
+                # Poprzednik j na nowej ścieżce: u dla j == v, w przeciwnym razie
+                # poprzednik j na ścieżce od v do j
+                if P is not None:
+                    P[i][j] = u if j == v else pred_v[j]
+    
+    return changed
@@ -0,0 +1,277 @@
+"""
+Wyznaczanie cyklu o minimalnej średniej wadze krawędzi w grafie skierowanym.
+
+Średnia waga cyklu to suma wag jego krawędzi podzielona przez liczbę krawędzi.
+Minimalna średnia jest ujemna wtedy i tylko wtedy, gdy graf zawiera cykl o ujemnej
+sumie wag, więc znaleziony cykl jest jednocześnie świadectwem takiego cyklu.
+
+Dostępne są dwa algorytmy:
+- Karpa - dokładny, O(VE) czasu, ale O(V²) pamięci (tablice odległości dla
+  ścieżek o k krawędziach, k = 0..V); poziomy są liczone wektorowo (NumPy),
+- Howarda (iteracja polityk) - w każdym wierzchołku wybierana jest jedna krawędź
+  wychodząca, a polityka jest poprawiana, dopóki to możliwe; w praktyce wystarcza
+  kilka-kilkanaście iteracji po O(V + E), a pamięć jest liniowa.
+"""
+
+import numpy as np
+from lab04.csr_graph import CSRGraph
+
+# Tolerancja porównań wartości w algorytmie Howarda (względem największej wagi)
+HOWARD_EPSILON = 1e-9
+
+def _edge_arrays(digraph):
+    """Zwraca graf jako tablice krawędzi (sources, targets, weights) w formacie CSR."""
+    csr = digraph if isinstance(digraph, CSRGraph) else CSRGraph.from_digraph(digraph)
+    return csr, csr.edge_sources(), csr.indices, csr.weights.astype(np.float64)
+
+def _cycle_result(cycle_edges, sources, targets, weights):
+    """Buduje wynik (cykl zamknięty, średnia waga) z listy indeksów krawędzi cyklu."""
+    cycle = [int(sources[e]) for e in cycle_edges]
+    cycle.append(int(targets[cycle_edges[-1]]))
+    mean = float(sum(weights[e] for e in cycle_edges)) / len(cycle_edges)
+    return cycle, mean
+
+def karp_min_mean_cycle(digraph):
+    """
+    Algorytm Karpa wyznaczania cyklu o minimalnej średniej wadze.
+
+    D[k][v] to najmniejsza waga drogi o dokładnie k krawędziach kończącej się w v
+    (z wirtualnego źródła połączonego krawędziami o wadze 0 ze wszystkimi
+    wierzchołkami). Minimalna średnia wynosi
+        min_v max_k (D[n][v] - D[k][v]) / (n - k),
+    a droga o n krawędziach do wierzchołka realizującego minimum zawiera cykl
+    o tej średniej.
+
+    Złożoność: O(VE) czasu i O(V²) pamięci.
+
+    Args:
+        digraph: DiGraph - graf skierowany z wagami (lub gotowy CSRGraph)
+
+    Returns:
+        Tuple (cycle, mean): cycle - lista wierzchołków cyklu (pierwszy powtórzony
+            na końcu), mean - średnia waga krawędzi cyklu; (None, None), jeśli graf
+            jest acykliczny
+    """
+    csr, sources, targets, weights = _edge_arrays(digraph)
+    n = csr.V
+    if n == 0 or csr.E == 0:
+        return None, None
+
+    edge_dtype = np.int32 if csr.E < 2 ** 31 else np.int64
+    D = np.full((n + 1, n), np.inf)
+    parent = np.full((n + 1, n), -1, dtype=edge_dtype)
+    D[0] = 0
+    edge_ids = np.arange(csr.E, dtype=edge_dtype)
+
+    # Poziom k wyznaczany wektorowo z poziomu k-1 dla wszystkich krawędzi naraz
+    for k in range(1, n + 1):
+        candidates = D[k - 1][sources] + weights
+        np.minimum.at(D[k], targets, candidates)
+        best = np.isfinite(candidates) & (candidates == D[k][targets])
+        parent[k][targets[best]] = edge_ids[best]
+
+    reachable = np.isfinite(D[n])
+    if not reachable.any():
+        return None, None
+
+    # max_k (D[n][v] - D[k][v]) / (n - k), pomijając poziomy, na których v jest nieosiągalny
+    with np.errstate(invalid='ignore'):
+        ratios = (D[n] - D[:n]) / (n - np.arange(n))[:, None]
+    ratios[~np.isfinite(D[:n])] = -np.inf
+    values = ratios.max(axis=0)
+    values[~reachable] = np.inf
+    v = int(values.argmin())
+
+    # Droga o n krawędziach do v (od końca); pierwszy powtórzony wierzchołek zamyka cykl
+    walk = [v]
+    walk_edges = []
+    position = {v: 0}
+    for k in range(n, 0, -1):
+        e = int(parent[k][walk[-1]])
+        u = int(sources[e])
+        walk_edges.append(e)
+        if u in position:
+            cycle_edges = walk_edges[position[u]:]
+            cycle_edges.reverse()
+            return _cycle_result(cycle_edges, sources, targets, weights)
+        position[u] = len(walk)
+        walk.append(u)
+
+    return None, None
+
+def _prune_acyclic(n, sources, targets):
+    """
+    Usuwa iteracyjnie wierzchołki bez krawędzi wychodzących do pozostałych wierzchołków.
+
+    Returns:
+        Tablica logiczna wierzchołków, z których można dojść do cyklu
+    """
+    out_degree = np.bincount(sources, minlength=n)
+    reverse = CSRGraph.from_edges(n, targets, sources, np.zeros(len(sources)))
+    alive = np.ones(n, dtype=bool)
+
+    stack = np.flatnonzero(out_degree == 0).tolist()
+    indptr, predecessors, _ = reverse.to_lists()
+    out_degree = out_degree.tolist()
+    while stack:
+        v = stack.pop()
+        alive[v] = False
+        for k in range(indptr[v], indptr[v + 1]):
+            u = predecessors[k]
+            out_degree[u] -= 1
+            if out_degree[u] == 0:
+                stack.append(u)
+
+    return alive
+
+def _evaluate_policy(policy, sources, targets, weights, alive):
+    """
+    Wyznacza dla polityki średnią cyklu osiąganego z każdego wierzchołka (eta) i potencjały (x).
+
+    Graf polityki ma dokładnie jedną krawędź wychodzącą z każdego wierzchołka,
+    więc każda jego składowa zawiera jeden cykl. Dla wierzchołków cyklu o średniej
+    eta potencjały spełniają x[u] = w(u, policy[u]) - eta + x[policy[u]] (z x = 0
+    w jednym wierzchołku cyklu), a pozostałe wierzchołki dziedziczą eta i x po
+    następniku.
+    """
+    n = len(policy)
+    successor = targets[policy].tolist()
+    step = weights[policy].tolist()
+
+    eta = [0.0] * n
+    x = [0.0] * n
+    state = [0] * n  # 0 - nieodwiedzony, 1 - na bieżącej ścieżce, 2 - obliczony
+
+    for start in np.flatnonzero(alive).tolist():
+        if state[start]:
+            continue
+
+        path = []
+        v = start
+        while state[v] == 0:
+            state[v] = 1
+            path.append(v)
+            v = successor[v]
+
+        if state[v] == 1:
+            # Domknięto nowy cykl - wierzchołki od v do końca ścieżki
+            cycle = path[path.index(v):]
+            cycle_eta = sum(step[u] for u in cycle) / len(cycle)
+            x[v] = 0.0
+            eta[v] = cycle_eta
+            state[v] = 2
+            for u in reversed(cycle[1:]):
+                eta[u] = cycle_eta
+                x[u] = step[u] - cycle_eta + x[successor[u]]
+                state[u] = 2
+            path = path[:path.index(v)]
+
+        for u in reversed(path):
+            eta[u] = eta[successor[u]]
+            x[u] = step[u] - eta[u] + x[successor[u]]
+            state[u] = 2
+
+    return np.array(eta), np.array(x)
+
+def howard_min_mean_cycle(digraph, max_iterations=None):
+    """
+    Algorytm Howarda (iteracja polityk) wyznaczania cyklu o minimalnej średniej wadze.
+
+    Polityka wybiera jedną krawędź wychodzącą z każdego wierzchołka. W każdej iteracji:
+    1. Ocena polityki: średnie cykli (eta) i potencjały (x) dla grafu polityki
+    2. Poprawa: wierzchołek przechodzi do następnika o mniejszej eta, a przy równych
+       eta - do krawędzi zmniejszającej potencjał w(u, v) - eta + x[v] < x[u]
+    Gdy polityki nie da się poprawić, najmniejsza eta jest minimalną średnią,
+    a cykl polityki osiągany z wierzchołka o tej eta jest szukanym cyklem.
+    Obie poprawy są wyznaczane wektorowo dla wszystkich krawędzi naraz.
+
+    Złożoność: O(V + E) na iterację; liczba iteracji jest w praktyce mała.
+
+    Args:
+        digraph: DiGraph - graf skierowany z wagami (lub gotowy CSRGraph)
+        max_iterations: Maksymalna liczba iteracji (None - bez limitu)
+
+    Returns:
+        Tuple (cycle, mean): jak w karp_min_mean_cycle
+    """
+    csr, sources, targets, weights = _edge_arrays(digraph)
+    n = csr.V
+    if n == 0 or csr.E == 0:
+        return None, None
+
+    # Wierzchołki, z których nie można dojść do cyklu, nie mają wpływu na wynik
+    alive = _prune_acyclic(n, sources, targets)
+    if not alive.any():
+        return None, None
+
+    edge_mask = alive[sources] & alive[targets]
+    edge_ids = np.flatnonzero(edge_mask)
+    e_sources, e_targets, e_weights = sources[edge_ids], targets[edge_ids], weights[edge_ids]
+    epsilon = HOWARD_EPSILON * max(1.0, float(np.abs(e_weights).max()))
+
+    # Polityka początkowa: najlżejsza krawędź wychodząca z każdego wierzchołka
+    order = np.lexsort((e_weights, e_sources))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = e_sources[order][1:] != e_sources[order][:-1]
+    policy = np.zeros(n, dtype=np.int64)
+    policy[e_sources[order[first]]] = edge_ids[order[first]]
+
+    iteration = 0
+    while max_iterations is None or iteration < max_iterations:
+        iteration += 1
+        eta, x = _evaluate_policy(policy, sources, targets, weights, alive)
+
+        # Krok 1: przejście do następnika o mniejszej średniej cyklu
+        improvement = eta[e_sources] - eta[e_targets]
+        candidates = improvement > epsilon
+        if not candidates.any():
+            # Krok 2: przy równych średnich - krawędź zmniejszająca potencjał
+            improvement = x[e_sources] - (e_weights - eta[e_sources] + x[e_targets])
+            candidates = (np.abs(eta[e_sources] - eta[e_targets]) <= epsilon) & (improvement > epsilon)
+            if not candidates.any():
+                break
+
+        # Dla każdego wierzchołka wybierz krawędź o największej poprawie
+        selected = np.flatnonzero(candidates)
+        selected = selected[np.lexsort((-improvement[selected], e_sources[selected]))]
+        first = np.ones(len(selected), dtype=bool)
+        first[1:] = e_sources[selected][1:] != e_sources[selected][:-1]
+        best = selected[first]
+        policy[e_sources[best]] = edge_ids[best]
+
+    eta, _ = _evaluate_policy(policy, sources, targets, weights, alive)
+    eta[~alive] = np.inf
+
+    # Cykl polityki osiągany z wierzchołka o najmniejszej średniej
+    v = int(eta.argmin())
+    seen = set()
+    while v not in seen:
+        seen.add(v)
+        v = int(targets[policy[v]])
+
+    cycle_edges = [int(policy[v])]
+    u = int(targets[policy[v]])
+    while u != v:
+        cycle_edges.append(int(policy[u]))
+        u = int(targets[policy[u]])
+
+    return _cycle_result(cycle_edges, sources, targets, weights)
+
+def min_mean_cycle(digraph, method='howard'):
+    """
+    Wyznacza cykl o minimalnej średniej wadze krawędzi.
+
+    Args:
+        digraph: DiGraph - graf skierowany z wagami (lub gotowy CSRGraph)
+        method: 'howard' (domyślnie, pamięć liniowa) lub 'karp' (O(V²) pamięci)
+
+    Returns:
+        Tuple (cycle, mean): cycle - lista wierzchołków cyklu (pierwszy powtórzony
+            na końcu), mean - średnia waga krawędzi cyklu; (None, None), jeśli graf
+            jest acykliczny. mean < 0 oznacza cykl o ujemnej sumie wag.
+    """
+    if method == 'howard':
+        return howard_min_mean_cycle(digraph)
+    if method == 'karp':
+        return karp_min_mean_cycle(digraph)
+    raise ValueError(f"Nieznana metoda: {method}")
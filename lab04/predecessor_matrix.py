@@ -0,0 +1,148 @@
+"""
+Zwarta macierz poprzedników dla najkrótszych ścieżek między wszystkimi parami wierzchołków.
+
+Zamiast listy list obiektów Pythona (z None dla braku poprzednika) poprzednicy są
+przechowywani w tablicy NumPy typu int32 z wartością -1 oznaczającą brak poprzednika.
+Dla n = 20000 zajmuje ona 1.6 GB zamiast około 3 GB, może być mapowana z pliku
+i współdzielona między procesami. Moduł udostępnia też wektorowe odtwarzanie
+wielu ścieżek naraz oraz szybkie wyznaczanie liczby krawędzi na ścieżce.
+"""
+
+import numpy as np
+
+# Wartość oznaczająca brak poprzednika w zwartej macierzy
+NO_PREDECESSOR = -1
+
+def new_predecessor_matrix(n, mmap_path=None):
+    """
+    Tworzy macierz poprzedników n×n typu int32 wypełnioną wartością NO_PREDECESSOR.
+
+    Args:
+        n: Liczba wierzchołków
+        mmap_path: Ścieżka pliku .npy, do którego macierz ma być mapowana (opcjonalna)
+
+    Returns:
+        Tablica NumPy (lub np.memmap, jeśli podano mmap_path)
+    """
+    if mmap_path is None:
+        return np.full((n, n), NO_PREDECESSOR, dtype=np.int32)
+
+    P = np.lib.format.open_memmap(mmap_path, mode='w+', dtype=np.int32, shape=(n, n))
+    P[:] = NO_PREDECESSOR
+    return P
+
+def compact_predecessor_matrix(P, mmap_path=None):
+    """
+    Zamienia macierz poprzedników w postaci listy list (z None) na zwartą tablicę int32.
+
+    Args:
+        P: Macierz poprzedników (wynik johnson_with_paths)
+        mmap_path: Ścieżka pliku .npy, do którego macierz ma być zapisana (opcjonalna)
+
+    Returns:
+        Tablica NumPy typu int32 z wartością -1 zamiast None
+    """
+    n = len(P)
+    compact = new_predecessor_matrix(n, mmap_path)
+    for u in range(n):
+        compact[u] = [p if p is not None else NO_PREDECESSOR for p in P[u]]
+
+    if mmap_path is not None:
+        compact.flush()
+    return compact
+
+def predecessor(P, u, v):
+    """
+    Zwraca poprzednika v na najkrótszej ścieżce z u (dla obu postaci macierzy).
+
+    Returns:
+        Indeks poprzednika lub None, jeśli poprzednik nie istnieje
+    """
+    p = P[u][v]
+    if p is None or p < 0:
+        return None
+    return int(p)
+
+def get_path_length(P, u, v):
+    """
+    Zwraca liczbę krawędzi na najkrótszej ścieżce od u do v bez budowania listy wierzchołków.
+
+    Args:
+        P: Macierz poprzedników (lista list lub tablica int32)
+        u: Wierzchołek źródłowy
+        v: Wierzchołek docelowy
+
+    Returns:
+        Liczba krawędzi ścieżki lub None, jeśli ścieżka nie istnieje
+    """
+    row = P[u]
+    length = 0
+    current = v
+    n = len(row)
+
+    while current != u:
+        current = row[current]
+        if current is None or current < 0 or length >= n:
+            return None
+        length += 1
+
+    return length
+
+def get_paths_batch(P, sources, targets):
+    """
+    Odtwarza wektorowo najkrótsze ścieżki dla wielu par (sources[i], targets[i]).
+
+    Wszystkie ścieżki są cofane jednocześnie: w każdym kroku jedna operacja
+    indeksowania tablicy pobiera poprzedników bieżących wierzchołków wszystkich
+    aktywnych par.
+
+    Args:
+        P: Macierz poprzedników (tablica int32 lub lista list)
+        sources: Lista wierzchołków źródłowych
+        targets: Lista wierzchołków docelowych (tej samej długości)
+
+    Returns:
+        Lista ścieżek (list wierzchołków od źródła do celu); None dla par bez ścieżki
+    """
+    if not isinstance(P, np.ndarray):
+        P = compact_predecessor_matrix(P)
+
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    if sources.shape != targets.shape:
+        raise ValueError("Listy źródeł i celów muszą mieć tę samą długość")
+
+    n = P.shape[0]
+    current = targets.copy()
+    trail = [current.copy()]
+    active = current != sources
+    reachable = np.ones(len(sources), dtype=bool)
+
+    steps = 0
+    while active.any() and steps < n:
+        indices = np.flatnonzero(active)
+        previous = P[sources[indices], current[indices]]
+
+        missing = previous < 0
+        reachable[indices[missing]] = False
+
+        current = current.copy()
+        current[indices] = previous
+        active[indices] = ~missing & (previous != sources[indices])
+        trail.append(current)
+        steps += 1
+
+    # Ścieżki dłuższe niż n krawędzi nie istnieją (uszkodzona macierz)
+    reachable &= ~active
+
+    # Liczba krawędzi ścieżki to liczba wierzchołków w kolumnie różnych od źródła
+    trail = np.vstack(trail)
+    lengths = (trail != sources).sum(axis=0)
+
+    paths = []
+    for i in range(len(sources)):
+        if not reachable[i]:
+            paths.append(None)
+        else:
+            paths.append(trail[:lengths[i] + 1, i][::-1].tolist())
+    return paths
@@ -2,7 +2,9 @@
 Generator losowych digrafów (skierowanych grafów) z zespołu G(n, p).
 """
 
+import math
 import random
+import numpy as np
 from lab04.digraph_representation import DiGraph
 
 def generate_random_digraph(n, p):
@@ -112,43 +114,66 @@ def generate_random_weighted_strongly_connected_digraph(n, p, min_weight=-5, max
     
     return None
 
-def ensure_no_negative_cycles(digraph, min_weight=-4, max_weight=10):
+def ensure_no_negative_cycles(digraph, min_weight=-4, max_weight=10, max_passes=None):
     """
     Modyfikuje wagi digrafu tak, aby nie zawierał cykli o ujemnej sumie wag.
     
-    Strategia:
-    1. Znajdź wszystkie cykle w digrafie
-    2. Dla każdego cyklu, sprawdź czy ma ujemną sumę wag
-    3. Jeśli tak, losowo zwiększ wagi niektórych krawędzi w cyklu
+    Strategia (naprawa wszystkich krawędzi naraz):
+    1. Wyznacz potencjały wierzchołków π wektorowymi przebiegami Bellmana-Forda
+       z wirtualnego źródła (wszystkie π startują od 0)
+    2. Jeśli przebiegi się ustabilizowały, graf nie ma cyklu o ujemnej sumie wag
+       i jest zwracany bez zmian; jeśli nie, a detect_negative_cycle nie znajduje
+       takiego cyklu (limit max_passes był za mały), przebiegi są kontynuowane
+       do ustabilizowania i graf również pozostaje bez zmian
+    3. W przeciwnym razie znajdź krawędzie naruszające warunek w(u, v) >= π[v] - π[u]
+       i każdej z nich przypisz losową wagę nie mniejszą niż π[v] - π[u]
+    
+    Po naprawie każda krawędź ma nieujemną wagę zredukowaną w(u, v) + π[u] - π[v],
+    a suma wag zredukowanych na cyklu jest równa sumie jego wag, więc graf na pewno
+    nie zawiera cyklu o ujemnej sumie wag. Wagi są zmieniane tylko wtedy, gdy graf
+    taki cykl zawierał.
+    
+    Złożoność: O(V · E) w najgorszym przypadku (bez cyklu o ujemnej sumie wag
+    przebiegi stabilizują się po co najwyżej V + 1 przebiegach).
     
     Args:
         digraph: DiGraph do modyfikacji
-        min_weight: Nowa minimalna wartość wagi (dla krawędzi w ujemnych cyklach)
-        max_weight: Nowa maksymalna wartość wagi (dla krawędzi w ujemnych cyklach)
+        min_weight: Nowa minimalna wartość wagi (dla naprawianych krawędzi)
+        max_weight: Nowa maksymalna wartość wagi (dla naprawianych krawędzi)
+        max_passes: Maksymalna liczba przebiegów przed sprawdzeniem, czy graf ma cykl
+                    o ujemnej sumie wag (None - V + 1, co wystarcza do ustabilizowania)
         
     Returns:
         DiGraph: Zmodyfikowany digraf bez ujemnych cykli
     """
-    from lab04.bellman_ford import has_negative_cycle, find_negative_cycle
+    from lab04.csr_graph import CSRGraph
+    from lab04.bellman_ford_numpy import relaxation_passes
+    from lab04.bellman_ford import detect_negative_cycle
     
-    # Dopóki graf ma ujemne cykle
-    while has_negative_cycle(digraph):
-        # Znajdź przykładowy ujemny cykl
-        cycle = find_negative_cycle(digraph)
-        
-        if not cycle:
-            break
-        
-        # Dla każdej krawędzi w cyklu, zwiększ jej wagę
-        for i in range(len(cycle) - 1):
-            u, v = cycle[i], cycle[i + 1]
-            old_weight = digraph.get_weight(u, v)
-            
-            # Przypisz nową, większą wagę
-            new_weight = random.randint(min(0, min_weight), max_weight)
-            if new_weight <= 0:
-                new_weight = 1  # Zapewnij, że waga nie będzie ujemna
-                
-            digraph.weights[(u, v)] = new_weight
-    
-    return digraph 
\ No newline at end of file
+    csr = CSRGraph.from_digraph(digraph)
+    sources = csr.edge_sources()
+    weights = csr.weights.astype(np.float64)
+    
+    if max_passes is None:
+        max_passes = csr.V + 1
+    
+    potentials = np.zeros(csr.V)
+    _, converged = relaxation_passes(sources, csr.indices, weights, potentials,
+                                     max_passes=max_passes)
+    if converged:
+        return digraph
+    
+    if detect_negative_cycle(digraph)[0] is None:
+        # Brak cyklu o ujemnej sumie wag - potencjały ustabilizują się bez zmian wag
+        return digraph
+    
+    # Najmniejsze wagi spełniające warunek dla każdej krawędzi
+    lower_bounds = potentials[csr.indices] - potentials[sources]
+    violating = np.flatnonzero(csr.weights < lower_bounds)
+    
+    for k in violating.tolist():
+        u, v = int(sources[k]), int(csr.indices[k])
+        low = max(math.ceil(lower_bounds[k]), min_weight)
+        digraph.weights[(u, v)] = random.randint(low, max(low, max_weight))
+    
+    return digraph